@@ -0,0 +1,35 @@
+"""Helpers shared by the HTTP benchmarks."""
+
+import uuid
+
+import aiohttp
+
+PASSWORD = "benchmark-password"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(len(ordered) * pct / 100), len(ordered) - 1)
+    return ordered[index]
+
+
+async def register(session: aiohttp.ClientSession, prefix: str) -> str:
+    email = f"{prefix}-{uuid.uuid4().hex[:12]}@example.com"
+    async with session.post(
+        "/register",
+        json={"email": email, "password": PASSWORD},
+    ) as resp:
+        resp.raise_for_status()
+
+    return email
+
+
+async def login(session: aiohttp.ClientSession, email: str) -> dict[str, str]:
+    async with session.post(
+        "/auth/token",
+        data={"username": email, "password": PASSWORD},
+    ) as resp:
+        resp.raise_for_status()
+        token = (await resp.json())["access_token"]
+
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,99 @@
+"""
+Compares creating N orders one by one with a single `POST /orders/bulk`.
+
+Runs against a live API; raise `RATE_LIMIT_WRITE` first so the single
+creates are not throttled:
+
+    python benchmarks/bulk_create.py --orders 500
+"""
+
+import asyncio
+import time
+
+import aiohttp
+from api_client import login
+from api_client import register
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+
+def build_orders(count: int, items_size: int) -> list[dict]:
+    return [
+        {
+            "items": {f"sku-{i}": i for i in range(items_size)},
+            "order_price": float(n),
+        }
+        for n in range(count)
+    ]
+
+
+async def create_one_by_one(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    orders: list[dict],
+    concurrency: int,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(order: dict) -> None:
+        async with semaphore:
+            async with session.post(
+                "/orders/",
+                json=order,
+                headers=headers,
+            ) as resp:
+                resp.raise_for_status()
+
+    await asyncio.gather(*(create(order) for order in orders))
+
+
+async def create_in_bulk(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    orders: list[dict],
+) -> None:
+    async with session.post(
+        "/orders/bulk",
+        json={"orders": orders},
+        headers=headers,
+    ) as resp:
+        resp.raise_for_status()
+
+
+async def run(
+    base_url: str,
+    orders: int,
+    items_size: int,
+    concurrency: int,
+) -> None:
+    payload = build_orders(orders, items_size)
+    async with aiohttp.ClientSession(base_url) as session:
+        headers = await login(session, await register(session, "bulk"))
+
+        started = time.perf_counter()
+        await create_one_by_one(session, headers, payload, concurrency)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await create_in_bulk(session, headers, payload)
+        bulk = time.perf_counter() - started
+
+    print(f"{orders} single creates: {single * 1000:.1f}ms")
+    print(f"1 bulk create:       {bulk * 1000:.1f}ms")
+    print(f"Speed-up:            {single / bulk:.1f}x")
+
+
+@app.command()
+def main(
+    base_url: str = Option("http://localhost:8000"),
+    orders: int = Option(500, help="Orders per run (max 1000 per bulk)"),
+    items_size: int = Option(10, help="Keys in every order's items"),
+    concurrency: int = Option(16, help="Parallel single creates"),
+) -> None:
+    asyncio.run(run(base_url, orders, items_size, concurrency))
+
+
+if __name__ == "__main__":
+    app()
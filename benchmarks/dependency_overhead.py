@@ -0,0 +1,63 @@
+"""
+Per-request cost of resolving the session maker and Redis client.
+
+Compares building a fresh `async_sessionmaker` and `Redis` client on every
+call (the previous dependencies) with returning the instances created once
+in `lifespan`. Nothing connects to Postgres or Redis.
+
+    PYTHONPATH=src python benchmarks/dependency_overhead.py
+"""
+
+import timeit
+from functools import partial
+from types import SimpleNamespace
+from typing import Any
+
+from order_service.dependencies.common import get_redis
+from order_service.dependencies.common import get_session_maker
+from redis.asyncio import ConnectionPool
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+
+def rebuild_per_request(request: Any) -> None:
+    async_sessionmaker(bind=request.app.state.engine, expire_on_commit=False)
+    Redis(connection_pool=request.app.state.redis_connection_pool)
+
+
+def shared_instances(request: Any) -> None:
+    get_session_maker(request)
+    get_redis(request)
+
+
+@app.command()
+def main(
+    number: int = Option(100_000, help="Resolutions per measurement"),
+    repeat: int = Option(5),
+) -> None:
+    engine = create_async_engine("postgresql+asyncpg://bench@localhost/bench")
+    pool = ConnectionPool.from_url("redis://localhost:6379/0")
+    state = SimpleNamespace(
+        engine=engine,
+        redis_connection_pool=pool,
+        session_maker=async_sessionmaker(bind=engine, expire_on_commit=False),
+        redis=Redis(connection_pool=pool),
+    )
+    request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+    for name, fn in (
+        ("rebuild per request", rebuild_per_request),
+        ("shared instances", shared_instances),
+    ):
+        measure = partial(fn, request)
+        best = min(timeit.repeat(measure, number=number, repeat=repeat))
+        print(f"{name:<20} {best / number * 1e6:8.3f} us/request")
+
+
+if __name__ == "__main__":
+    app()
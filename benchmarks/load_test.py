@@ -0,0 +1,324 @@
+"""
+Mixed-workload load test of the order API.
+
+Registers `--users` users, logs each of them in through `/auth/token` and
+seeds their orders, then `--concurrency` clients drive random creates,
+gets, cursor listings and status updates for `--duration` seconds. The
+`--mix` weights set the ratio, e.g. `create=1,get=6,list=2,patch=1`.
+Prints throughput and p50/p95/p99 latency per route and writes them as
+JSON to `--output`; pass an earlier file as `--baseline` to print the
+change against it.
+
+Runs against a live API (e.g. `docker compose up`). Raise the
+`RATE_LIMIT_*` limits first, otherwise most requests answer 429:
+
+    python benchmarks/load_test.py --duration 60 --output after.json \\
+        --baseline before.json
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import UTC
+from pathlib import Path
+
+import aiohttp
+from api_client import login
+from api_client import percentile
+from api_client import register
+from typer import BadParameter
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+OPERATIONS = ("create", "get", "list", "patch")
+ROUTES = {
+    "create": "POST /orders/",
+    "get": "GET /orders/{order_id}",
+    "list": "GET /orders/user/{user_id}/cursor",
+    "patch": "PATCH /orders/{order_id}",
+}
+
+
+@dataclass
+class VirtualUser:
+    user_id: str
+    headers: dict[str, str]
+    order_ids: list[str]
+    # Orders nobody has updated yet, so every PATCH is a valid move
+    pending_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RouteSamples:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    def record(self, status: int, latency_ms: float) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def summary(self, elapsed: float) -> dict:
+        samples = self.latencies_ms
+        errors = 0
+        for status, count in self.statuses.items():
+            if status >= 400:
+                errors += count
+        return {
+            "requests": len(samples),
+            "errors": errors,
+            "throughput_rps": round(len(samples) / elapsed, 1),
+            "mean_ms": round(statistics.mean(samples), 2),
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p95_ms": round(percentile(samples, 95), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+        }
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    weights = dict.fromkeys(OPERATIONS, 0)
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in weights or not weight.strip().isdigit():
+            raise BadParameter(f"Invalid mix entry {part!r}")
+        weights[name] = int(weight)
+
+    if not any(weights.values()):
+        raise BadParameter("Mix needs at least one positive weight")
+    return weights
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+async def setup_user(
+    session: aiohttp.ClientSession,
+    seed_orders: int,
+) -> VirtualUser:
+    headers = await login(session, await register(session, "load"))
+    async with session.post(
+        "/orders/bulk",
+        json={
+            "orders": [
+                {"items": {"sku": f"seed-{i}"}, "order_price": 10.0}
+                for i in range(seed_orders)
+            ]
+        },
+        headers=headers,
+    ) as resp:
+        resp.raise_for_status()
+        orders = await resp.json()
+
+    order_ids = [order["id"] for order in orders]
+    return VirtualUser(
+        user_id=orders[0]["creator_id"],
+        headers=headers,
+        order_ids=order_ids,
+        pending_ids=list(order_ids),
+    )
+
+
+async def request(
+    session: aiohttp.ClientSession,
+    user: VirtualUser,
+    operation: str,
+    page_size: int,
+) -> int:
+    if operation == "create":
+        async with session.post(
+            "/orders/",
+            json={"items": {"sku": "load"}, "order_price": 10.0},
+            headers=user.headers,
+        ) as resp:
+            body = await resp.read()
+            if resp.status == 200:
+                order_id = json.loads(body)["id"]
+                user.order_ids.append(order_id)
+                user.pending_ids.append(order_id)
+            return resp.status
+
+    if operation == "patch":
+        async with session.patch(
+            f"/orders/{user.pending_ids.pop()}",
+            json={"status": "CANCELED"},
+            headers=user.headers,
+        ) as resp:
+            await resp.read()
+            return resp.status
+
+    if operation == "list":
+        url = f"/orders/user/{user.user_id}/cursor?page_size={page_size}"
+    else:
+        url = f"/orders/{random.choice(user.order_ids)}"
+    async with session.get(url, headers=user.headers) as resp:
+        await resp.read()
+        return resp.status
+
+
+async def drive(
+    session: aiohttp.ClientSession,
+    users: list[VirtualUser],
+    weights: dict[str, int],
+    page_size: int,
+    deadline: float,
+    samples: dict[str, RouteSamples],
+) -> None:
+    operations = list(weights)
+    relative_weights = list(weights.values())
+    while time.perf_counter() < deadline:
+        user = random.choice(users)
+        operation = random.choices(operations, relative_weights)[0]
+        if operation == "patch" and not user.pending_ids:
+            operation = "get"
+
+        started = time.perf_counter()
+        try:
+            status = await request(session, user, operation, page_size)
+        except aiohttp.ClientError:
+            status = 599
+        latency_ms = (time.perf_counter() - started) * 1000
+        samples[ROUTES[operation]].record(status, latency_ms)
+
+
+def print_report(routes: dict[str, dict], baseline: dict | None) -> None:
+    print(
+        f"{'route':<34} {'reqs':>7} {'err':>5} {'rps':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for route, stats in routes.items():
+        print(
+            f"{route:<34} {stats['requests']:>7} {stats['errors']:>5} "
+            f"{stats['throughput_rps']:>8.1f} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+        previous = (baseline or {}).get("routes", {}).get(route)
+        if previous:
+            rps_change = stats["throughput_rps"] / previous["throughput_rps"]
+            p95_change = stats["p95_ms"] / previous["p95_ms"]
+            print(
+                f"{'  vs baseline':<34} {'':>7} {'':>5} "
+                f"{rps_change - 1:>+8.1%} {'':>8} {p95_change - 1:>+8.1%}"
+            )
+
+
+async def run(
+    base_url: str,
+    users: int,
+    seed_orders: int,
+    concurrency: int,
+    duration: float,
+    weights: dict[str, int],
+    page_size: int,
+) -> tuple[dict[str, dict], float]:
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(base_url, connector=connector) as session:
+        virtual_users = await asyncio.gather(
+            *(setup_user(session, seed_orders) for _ in range(users))
+        )
+
+        samples = {route: RouteSamples() for route in ROUTES.values()}
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                drive(
+                    session,
+                    virtual_users,
+                    weights,
+                    page_size,
+                    deadline,
+                    samples,
+                )
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    routes = {
+        route: route_samples.summary(elapsed)
+        for route, route_samples in samples.items()
+        if route_samples.latencies_ms
+    }
+    return routes, elapsed
+
+
+@app.command()
+def main(
+    base_url: str = Option("http://localhost:8000"),
+    users: int = Option(20, help="Registered users the load is spread over"),
+    seed_orders: int = Option(
+        20,
+        min=1,
+        help="Orders created per user upfront",
+    ),
+    concurrency: int = Option(32, help="Clients sending requests at once"),
+    duration: float = Option(30, help="Seconds to drive the workload"),
+    mix: str = Option(
+        "create=1,get=6,list=2,patch=1",
+        help="Relative weights of create/get/list/patch requests",
+    ),
+    page_size: int = Option(20, help="Page size of listing requests"),
+    output: Path | None = Option(None, help="Write results as JSON"),
+    baseline: Path | None = Option(None, help="Earlier results to compare"),
+) -> None:
+    weights = parse_mix(mix)
+    previous = json.loads(baseline.read_text()) if baseline else None
+    started_at = datetime.now(UTC).isoformat()
+    routes, elapsed = asyncio.run(
+        run(
+            base_url,
+            users,
+            seed_orders,
+            concurrency,
+            duration,
+            weights,
+            page_size,
+        )
+    )
+
+    total = sum(stats["requests"] for stats in routes.values())
+    print(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.0f}/s)")
+    print_report(routes, previous)
+
+    if output is not None:
+        result = {
+            "commit": git_commit(),
+            "started_at": started_at,
+            "config": {
+                "base_url": base_url,
+                "users": users,
+                "seed_orders": seed_orders,
+                "concurrency": concurrency,
+                "duration_seconds": duration,
+                "mix": weights,
+                "page_size": page_size,
+            },
+            "elapsed_seconds": round(elapsed, 2),
+            "total_requests": total,
+            "routes": routes,
+        }
+        output.write_text(json.dumps(result, indent=2))
+        print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,139 @@
+"""
+Measures `GET /orders/{id}` latency while concurrent logins hash passwords.
+
+Runs against a live API (e.g. `docker compose up`). Raise `RATE_LIMIT_AUTH`,
+`RATE_LIMIT_READ` and `RATE_LIMIT_IP` on the API first, otherwise the limiter
+rejects most of the storm:
+
+    python benchmarks/login_storm.py --base-url http://localhost:8000
+"""
+
+import asyncio
+import statistics
+import time
+
+import aiohttp
+from api_client import login
+from api_client import PASSWORD
+from api_client import percentile
+from api_client import register
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+
+async def prepare(
+    session: aiohttp.ClientSession,
+) -> tuple[str, dict[str, str], str]:
+    email = await register(session, "storm")
+    headers = await login(session, email)
+    async with session.post(
+        "/orders/",
+        json={"items": {"sku": "storm"}, "order_price": 1.0},
+        headers=headers,
+    ) as resp:
+        resp.raise_for_status()
+        order_id = (await resp.json())["id"]
+
+    return email, headers, f"/orders/{order_id}"
+
+
+async def read_orders(
+    session: aiohttp.ClientSession,
+    path: str,
+    headers: dict[str, str],
+    stop: asyncio.Event,
+    latencies: list[float],
+) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        async with session.get(path, headers=headers) as resp:
+            await resp.read()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def storm_logins(
+    session: aiohttp.ClientSession,
+    email: str,
+    stop: asyncio.Event,
+    statuses: dict[int, int],
+) -> None:
+    while not stop.is_set():
+        async with session.post(
+            "/auth/token",
+            data={"username": email, "password": PASSWORD},
+        ) as resp:
+            await resp.read()
+            statuses[resp.status] = statuses.get(resp.status, 0) + 1
+
+
+async def phase(
+    session: aiohttp.ClientSession,
+    email: str,
+    path: str,
+    headers: dict[str, str],
+    readers: int,
+    logins: int,
+    duration: float,
+) -> None:
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    tasks = []
+    for _ in range(readers):
+        reader = read_orders(session, path, headers, stop, latencies)
+        tasks.append(asyncio.create_task(reader))
+    for _ in range(logins):
+        storm = storm_logins(session, email, stop, statuses)
+        tasks.append(asyncio.create_task(storm))
+
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    print(
+        f"logins={logins:<4} reads={len(latencies):<6} "
+        f"p50={statistics.median(latencies):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms "
+        f"max={max(latencies):.1f}ms "
+        f"login statuses={statuses}"
+    )
+
+
+async def run(
+    base_url: str,
+    readers: int,
+    logins: list[int],
+    duration: float,
+) -> None:
+    connector = aiohttp.TCPConnector(limit=readers + max(logins))
+    async with aiohttp.ClientSession(base_url, connector=connector) as session:
+        email, headers, path = await prepare(session)
+        for concurrent_logins in logins:
+            await phase(
+                session,
+                email,
+                path,
+                headers,
+                readers,
+                concurrent_logins,
+                duration,
+            )
+
+
+@app.command()
+def main(
+    base_url: str = Option("http://localhost:8000"),
+    readers: int = Option(8, help="Concurrent GET /orders/{id} loops"),
+    logins: list[int] = Option(
+        [0, 8, 32],
+        help="Concurrent login loops per phase",
+    ),
+    duration: float = Option(10.0, help="Seconds per phase"),
+) -> None:
+    asyncio.run(run(base_url, readers, logins, duration))
+
+
+if __name__ == "__main__":
+    app()
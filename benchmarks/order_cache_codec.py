@@ -0,0 +1,142 @@
+"""
+Cost of the order cache layouts for growing `items` payloads.
+
+Compares the legacy per-field Redis hash (`strftime` plus a nested
+`json.dumps` of `items`) with the single-string `JsonOrderCodec`: encode and
+decode time per order and, with `--redis-url`, Redis `MEMORY USAGE` per
+cached order. Bench keys are deleted afterwards.
+
+    PYTHONPATH=src python benchmarks/order_cache_codec.py \\
+        --items-size 10 --items-size 1000 --redis-url redis://localhost:6379/0
+"""
+
+import asyncio
+import statistics
+import timeit
+from datetime import datetime
+
+from order_service.dto.order import OrderDTO
+from order_service.enums.order import OrderStatus
+from order_service.helpers.order_codec import JsonOrderCodec
+from order_service.repos.order import OrderRepository
+from redis.asyncio import Redis
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+BENCH_KEY_PREFIX = "order-codec-bench"
+
+
+def build_order(items_size: int) -> OrderDTO:
+    return OrderDTO(
+        id="01JBENCHORDER0000000000000",
+        items={
+            f"sku-{i}": {"qty": i, "title": f"Item number {i}", "price": 9.99}
+            for i in range(items_size)
+        },
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+        creator_id="01JBENCHUSER00000000000000",
+        order_price=123.45,
+    )
+
+
+def time_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+async def memory_per_order(
+    redis: Redis,
+    order: OrderDTO,
+    codec: JsonOrderCodec,
+    samples: int,
+) -> tuple[float, float]:
+    hash_keys = [f"{BENCH_KEY_PREFIX}:hash:{i}" for i in range(samples)]
+    string_keys = [f"{BENCH_KEY_PREFIX}:string:{i}" for i in range(samples)]
+    pipe = redis.pipeline(transaction=False)
+    for key in hash_keys:
+        pipe.hset(key, mapping=OrderRepository._dump_order(order))
+    for key in string_keys:
+        pipe.set(key, codec.encode(order))
+    await pipe.execute()
+
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for key in hash_keys + string_keys:
+            pipe.memory_usage(key)
+        usage = await pipe.execute()
+    finally:
+        await redis.delete(*hash_keys, *string_keys)
+
+    return (
+        statistics.mean(usage[:samples]),
+        statistics.mean(usage[samples:]),
+    )
+
+
+async def run(
+    items_sizes: list[int],
+    number: int,
+    redis_url: str | None,
+    samples: int,
+) -> None:
+    codec = JsonOrderCodec()
+    redis = Redis.from_url(redis_url) if redis_url else None
+
+    print(
+        f"{'items':>6} {'layout':>7} {'encode us':>10} "
+        f"{'decode us':>10} {'redis B':>8}"
+    )
+    for items_size in items_sizes:
+        order = build_order(items_size)
+        fields = OrderRepository._dump_order(order)
+        value = codec.encode(order)
+
+        memory: tuple[float, float] | None = None
+        if redis is not None:
+            memory = await memory_per_order(redis, order, codec, samples)
+
+        rows = (
+            (
+                "hash",
+                time_us(lambda: OrderRepository._dump_order(order), number),
+                time_us(lambda: OrderRepository._load_order(fields), number),
+                memory[0] if memory else None,
+            ),
+            (
+                "codec",
+                time_us(lambda: codec.encode(order), number),
+                time_us(lambda: codec.decode(value), number),
+                memory[1] if memory else None,
+            ),
+        )
+        for layout, encode_us, decode_us, used in rows:
+            used_str = f"{used:8.0f}" if used is not None else f"{'-':>8}"
+            print(
+                f"{items_size:>6} {layout:>7} {encode_us:10.2f} "
+                f"{decode_us:10.2f} {used_str}"
+            )
+
+    if redis is not None:
+        await redis.aclose()
+
+
+@app.command()
+def main(
+    items_size: list[int] = Option(
+        [10, 100, 1000],
+        help="Keys in the order's items, one row per value",
+    ),
+    number: int = Option(2_000, help="Encodes/decodes per measurement"),
+    redis_url: str | None = Option(
+        None,
+        help="Also measure MEMORY USAGE per cached order",
+    ),
+    samples: int = Option(100, help="Orders written per layout for memory"),
+) -> None:
+    asyncio.run(run(items_size, number, redis_url, samples))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,210 @@
+"""
+Compares per-user order listing with and without the
+`ix_order_user_id_created_at_id` index.
+
+Seeds the configured database (see `order_service.settings.Settings`) with
+bench users and orders, then runs the listing queries issued by
+`OrderRepository` and prints their plans and latencies. The index is dropped
+or created inside a transaction that is rolled back, so the schema is left
+untouched.
+
+    PYTHONPATH=src python benchmarks/order_listing.py --orders 1000000
+"""
+
+import asyncio
+import statistics
+import time
+
+from order_service.settings import Settings
+from sqlalchemy import text
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import create_async_engine
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+BENCH_EMAIL_DOMAIN = "listing-bench.local"
+INDEX_NAME = "ix_order_user_id_created_at_id"
+
+SEED_USERS = text(
+    """
+    INSERT INTO users (id, email, hashed_password)
+    SELECT 'bench-' || g, 'user-' || g || '@' || CAST(:domain AS text), '-'
+    FROM generate_series(1, CAST(:users AS integer)) AS g
+    ON CONFLICT DO NOTHING
+    """
+)
+SEED_ORDERS = text(
+    """
+    INSERT INTO "order" (id, user_id, items, status, created_at, order_price)
+    SELECT
+        'bench-' || lpad(g::text, 10, '0'),
+        'bench-' || (1 + g % CAST(:users AS integer)),
+        '{"sku": "bench", "qty": 1}'::json,
+        'PENDING',
+        now() - g * interval '1 second',
+        g % 1000
+    FROM generate_series(
+        CAST(:start AS integer), CAST(:stop AS integer)
+    ) AS g
+    """
+)
+COUNT_ORDERS = text(
+    """
+    SELECT count(*) FROM "order" WHERE id LIKE 'bench-%'
+    """
+)
+QUERIES = {
+    "count": """
+        SELECT count(*) FROM "order" WHERE user_id = :user_id
+    """,
+    "first_page": """
+        SELECT * FROM "order" WHERE user_id = :user_id
+        ORDER BY created_at DESC, id LIMIT :limit
+    """,
+    "deep_offset_page": """
+        SELECT * FROM "order" WHERE user_id = :user_id
+        ORDER BY created_at DESC, id OFFSET :offset LIMIT :limit
+    """,
+    # The keyset predicate alone: the index only seeks on `user_id`
+    "deep_cursor_page_or_only": """
+        SELECT * FROM "order" WHERE user_id = :user_id
+        AND (
+            created_at < :created_at
+            OR (created_at = :created_at AND id > :id)
+        )
+        ORDER BY created_at DESC, id LIMIT :limit
+    """,
+    # As `OrderRepository` issues it: `created_at <=` is an index bound
+    "deep_cursor_page": """
+        SELECT * FROM "order" WHERE user_id = :user_id
+        AND created_at <= :created_at
+        AND (created_at < :created_at OR id > :id)
+        ORDER BY created_at DESC, id LIMIT :limit
+    """,
+}
+
+
+def build_uri(settings: Settings) -> URL:
+    return URL.create(
+        drivername=settings.db_driver,
+        username=settings.db_user,
+        password=settings.db_password,
+        host=settings.db_host,
+        port=settings.db_port,
+        database=settings.db_name,
+    )
+
+
+async def seed(
+    conn: AsyncConnection,
+    users: int,
+    orders: int,
+    chunk: int = 100_000,
+) -> None:
+    await conn.execute(
+        SEED_USERS,
+        {"users": users, "domain": BENCH_EMAIL_DOMAIN},
+    )
+    existing = await conn.scalar(COUNT_ORDERS) or 0
+    for start in range(existing + 1, orders + 1, chunk):
+        stop = min(start + chunk - 1, orders)
+        await conn.execute(
+            SEED_ORDERS,
+            {"users": users, "start": start, "stop": stop},
+        )
+        print(f"Seeded orders {start}..{stop}", flush=True)
+    await conn.commit()
+
+
+async def measure(
+    conn: AsyncConnection,
+    params: dict,
+    repeats: int,
+) -> None:
+    for name, sql in QUERIES.items():
+        plan = await conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"),
+            params,
+        )
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            await conn.execute(text(sql), params)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        print(
+            f"-- {name}: p50={statistics.median(timings):.2f}ms "
+            f"max={max(timings):.2f}ms"
+        )
+        for (line,) in plan:
+            print(f"   {line}")
+
+
+async def run(
+    users: int,
+    orders: int,
+    page_size: int,
+    repeats: int,
+) -> None:
+    engine = create_async_engine(build_uri(Settings()))
+    user_id = "bench-1"
+
+    async with engine.connect() as conn:
+        await seed(conn, users, orders)
+        await conn.execute(text('ANALYZE "order"'))
+        await conn.commit()
+
+        user_orders = await conn.scalar(
+            text('SELECT count(*) FROM "order" WHERE user_id = :user_id'),
+            {"user_id": user_id},
+        )
+        offset = max((user_orders or 0) - page_size, 0)
+        boundary = (
+            await conn.execute(
+                text(
+                    'SELECT created_at, id FROM "order" WHERE user_id = :uid '
+                    "ORDER BY created_at DESC, id OFFSET :offset LIMIT 1"
+                ),
+                {"uid": user_id, "offset": max(offset - 1, 0)},
+            )
+        ).one()
+        params = {
+            "user_id": user_id,
+            "limit": page_size,
+            "offset": offset,
+            "created_at": boundary.created_at,
+            "id": boundary.id,
+        }
+        print(f"User {user_id} has {user_orders} of {orders} orders")
+
+        variants = {
+            "Without": f"DROP INDEX IF EXISTS {INDEX_NAME}",
+            "With": (
+                f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+                'ON "order" (user_id, created_at DESC, id)'
+            ),
+        }
+        for variant, ddl in variants.items():
+            print(f"\n=== {variant} {INDEX_NAME}")
+            await conn.execute(text(ddl))
+            await measure(conn, params, repeats)
+            await conn.rollback()
+
+    await engine.dispose()
+
+
+@app.command()
+def main(
+    users: int = Option(100, help="Bench users to spread orders over"),
+    orders: int = Option(1_000_000, help="Total bench orders to seed"),
+    page_size: int = Option(20),
+    repeats: int = Option(20, help="Timed runs per query"),
+) -> None:
+    asyncio.run(run(users, orders, page_size, repeats))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,103 @@
+"""
+Cost of serializing order responses for growing `items` payloads.
+
+Compares FastAPI's default path for a route with a `response_model`
+(validating the DTO into the schema, dumping it in JSON mode and encoding
+it with the stdlib `json`, as `JSONResponse` does) with `DtoJSONResponse`,
+which serializes the DTO straight to bytes. Measures a single order and a
+`Page[OrderSchema]` of `--page-size` orders; no running services needed.
+
+    PYTHONPATH=src python benchmarks/order_serialization.py \\
+        --items-size 10 --items-size 1000 --page-size 50
+"""
+
+import json
+import timeit
+from datetime import datetime
+from typing import Any
+
+from order_service.dto.base import PageDTO
+from order_service.dto.order import OrderDTO
+from order_service.enums.order import OrderStatus
+from order_service.helpers.responses import DtoJSONResponse
+from order_service.schemas.base import Page
+from order_service.schemas.order import OrderSchema
+from pydantic import TypeAdapter
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+
+def build_order(items_size: int) -> OrderDTO:
+    return OrderDTO(
+        id="01JBENCHORDER0000000000000",
+        items={
+            f"sku-{i}": {"qty": i, "title": f"Item number {i}", "price": 9.99}
+            for i in range(items_size)
+        },
+        status=OrderStatus.PENDING,
+        created_at=datetime.now(),
+        creator_id="01JBENCHUSER00000000000000",
+        order_price=123.45,
+    )
+
+
+def fastapi_default(adapter: TypeAdapter, content: Any) -> bytes:
+    model = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(
+        adapter.dump_python(model, mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def time_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+@app.command()
+def main(
+    items_size: list[int] = Option(
+        [10, 100, 1000],
+        help="Keys in each order's items, one row per value",
+    ),
+    page_size: int = Option(50, help="Orders in the page payload"),
+    number: int = Option(200, help="Serializations per measurement"),
+) -> None:
+    order_adapter = TypeAdapter(OrderSchema)
+    page_adapter = TypeAdapter(Page[OrderSchema])
+    response = DtoJSONResponse(content=None)
+
+    print(
+        f"{'items':>6} {'payload':>8} {'default us':>11} "
+        f"{'dto us':>9} {'speedup':>8}"
+    )
+    for size in items_size:
+        order = build_order(size)
+        page = PageDTO(
+            items=[order] * page_size,
+            page_size=page_size,
+            total_pages=1,
+            total_items=page_size,
+            page=1,
+        )
+        for payload, adapter, content in (
+            ("order", order_adapter, order),
+            ("page", page_adapter, page),
+        ):
+            default_us = time_us(
+                lambda: fastapi_default(adapter, content),
+                number,
+            )
+            dto_us = time_us(lambda: response.render(content), number)
+            print(
+                f"{size:>6} {payload:>8} {default_us:11.1f} "
+                f"{dto_us:9.1f} {default_us / dto_us:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,155 @@
+"""
+Stress test for concurrent `PATCH /orders/{id}` status updates.
+
+Creates orders and fires racing compare-and-set updates at each of them:
+every updater expects `PENDING` and moves the order to `PAID` or `CANCELED`.
+At most one updater may win per order, every loser must get 409, and the
+stored status must match the winner. The worker may pay an order before
+any updater does, then all updaters lose. Stored statuses are read from
+the configured database (see `order_service.settings.Settings`), since
+`GET /orders/{id}` may answer from the cache.
+
+Runs against a live API. All updates come from one user, so raise
+`RATE_LIMIT_WRITE` and `RATE_LIMIT_IP` first, otherwise most updates
+answer 429 and count as violations:
+
+    PYTHONPATH=src python benchmarks/status_contention.py \\
+        --orders 200 --updaters 16
+"""
+
+import asyncio
+import random
+import time
+
+import aiohttp
+from api_client import login
+from api_client import register
+from order_service.settings import Settings
+from sqlalchemy import text
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import create_async_engine
+from typer import Exit
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+TARGETS = ("PAID", "CANCELED")
+STORED_STATUSES = text(
+    """
+    SELECT id, status FROM "order" WHERE id = ANY(:ids)
+    """
+)
+
+
+async def create_orders(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    count: int,
+) -> list[str]:
+    async with session.post(
+        "/orders/bulk",
+        json={
+            "orders": [
+                {"items": {"sku": "contention"}, "order_price": 1.0}
+                for _ in range(count)
+            ]
+        },
+        headers=headers,
+    ) as resp:
+        resp.raise_for_status()
+        return [order["id"] for order in await resp.json()]
+
+
+async def race(
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    order_id: str,
+    updaters: int,
+) -> tuple[list[str], dict[int, int]]:
+    async def update(target: str) -> tuple[int, str]:
+        async with session.patch(
+            f"/orders/{order_id}",
+            json={"status": target, "expected_status": "PENDING"},
+            headers=headers,
+        ) as resp:
+            await resp.read()
+            return resp.status, target
+
+    results = await asyncio.gather(
+        *(update(random.choice(TARGETS)) for _ in range(updaters))
+    )
+    statuses: dict[int, int] = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    winners = [target for status, target in results if status == 200]
+    return winners, statuses
+
+
+async def stored_statuses(order_ids: list[str]) -> dict[str, str]:
+    settings = Settings()
+    engine = create_async_engine(
+        URL.create(
+            drivername=settings.db_driver,
+            username=settings.db_user,
+            password=settings.db_password,
+            host=settings.db_host,
+            port=settings.db_port,
+            database=settings.db_name,
+        )
+    )
+    try:
+        async with engine.connect() as conn:
+            rows = await conn.execute(STORED_STATUSES, {"ids": order_ids})
+            return {order_id: str(status) for order_id, status in rows}
+    finally:
+        await engine.dispose()
+
+
+async def run(base_url: str, orders: int, updaters: int) -> int:
+    connector = aiohttp.TCPConnector(limit=updaters * 4)
+    async with aiohttp.ClientSession(base_url, connector=connector) as session:
+        headers = await login(session, await register(session, "contention"))
+        order_ids = await create_orders(session, headers, orders)
+
+        started = time.perf_counter()
+        races = await asyncio.gather(
+            *(race(session, headers, oid, updaters) for oid in order_ids)
+        )
+        elapsed = time.perf_counter() - started
+
+        stored_by_id = await stored_statuses(order_ids)
+        totals: dict[int, int] = {}
+        violations = 0
+        for order_id, (winners, statuses) in zip(order_ids, races):
+            for status, count in statuses.items():
+                totals[status] = totals.get(status, 0) + count
+
+            stored = stored_by_id[order_id]
+            expected = winners[0] if winners else "PAID"
+            lost_update = len(winners) > 1 or stored != expected
+            unexpected = set(statuses) - {200, 409}
+            if lost_update or unexpected:
+                violations += 1
+                print(f"{order_id}: {winners=} {stored=} {statuses}")
+
+    requests = orders * updaters
+    print(f"{requests} updates in {elapsed:.2f}s ({requests / elapsed:.0f}/s)")
+    print(f"Statuses: {totals}")
+    print(f"Orders with lost updates: {violations}/{orders}")
+    return violations
+
+
+@app.command()
+def main(
+    base_url: str = Option("http://localhost:8000"),
+    orders: int = Option(200, help="Orders to race on (max 1000)"),
+    updaters: int = Option(16, help="Concurrent updaters per order"),
+) -> None:
+    if asyncio.run(run(base_url, orders, updaters)):
+        raise Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,110 @@
+"""
+Orders/s processed by `order_worker` against a local Postgres and Redis.
+
+Seeds PENDING orders, enqueues one `process_incoming_order` task per order
+and waits until the worker moved all of them to PAID. Start the worker
+separately with the parallelism under test, e.g.:
+
+    WORKER_PROCESSES=1 WORKER_CONCURRENCY=20 scripts/start-worker.sh
+    PYTHONPATH=src python benchmarks/worker_throughput.py --orders 20000
+"""
+
+import asyncio
+import time
+import uuid
+
+from order_service.enums.order import OrderStatus
+from order_worker.settings import settings
+from order_worker.taskiq_app import broker
+from order_worker.tasks import process_incoming_order
+from sqlalchemy import text
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import create_async_engine
+from typer import Option
+from typer import Typer
+
+app = Typer()
+
+SEED_USER = text(
+    """
+    INSERT INTO users (id, email, hashed_password)
+    VALUES (:user_id, :user_id || '@worker-bench.local', '-')
+    """
+)
+SEED_ORDERS = text(
+    """
+    INSERT INTO "order" (id, user_id, items, status, created_at, order_price)
+    SELECT
+        CAST(:prefix AS text) || lpad(g::text, 10, '0'),
+        :user_id,
+        '{"sku": "bench"}'::json,
+        'PENDING',
+        now(),
+        1
+    FROM generate_series(1, CAST(:orders AS integer)) AS g
+    """
+)
+COUNT_PAID = text(
+    """
+    SELECT count(*) FROM "order" WHERE user_id = :user_id AND status = :status
+    """
+)
+
+
+async def run(orders: int, enqueue_batch: int, timeout: float) -> None:
+    engine = create_async_engine(
+        URL.create(
+            drivername=settings.db_driver,
+            username=settings.db_user,
+            password=settings.db_password,
+            host=settings.db_host,
+            port=settings.db_port,
+            database=settings.db_name,
+        )
+    )
+    user_id = f"worker-bench-{uuid.uuid4().hex[:8]}"
+    params = {"user_id": user_id, "prefix": f"{user_id}-", "orders": orders}
+
+    async with engine.begin() as conn:
+        await conn.execute(SEED_USER, params)
+        await conn.execute(SEED_ORDERS, params)
+
+    order_ids = [f"{user_id}-{i:010d}" for i in range(1, orders + 1)]
+    started = time.perf_counter()
+    for offset in range(0, orders, enqueue_batch):
+        batch = order_ids[offset:][:enqueue_batch]
+        await broker.kiq_batch(
+            process_incoming_order,
+            [{"id": order_id} for order_id in batch],
+        )
+    enqueued = time.perf_counter() - started
+    print(f"Enqueued {orders} tasks in {enqueued:.2f}s")
+
+    paid = 0
+    async with engine.connect() as conn:
+        while paid < orders and time.perf_counter() - started < timeout:
+            await asyncio.sleep(0.5)
+            paid = await conn.scalar(
+                COUNT_PAID,
+                {"user_id": user_id, "status": OrderStatus.PAID.value},
+            )
+            await conn.rollback()
+
+    elapsed = time.perf_counter() - started
+    print(f"Processed {paid}/{orders} orders in {elapsed:.2f}s")
+    print(f"Throughput: {paid / elapsed:.1f} orders/s")
+
+    await engine.dispose()
+
+
+@app.command()
+def main(
+    orders: int = Option(10_000, help="Orders to seed and process"),
+    enqueue_batch: int = Option(500, help="Tasks per pipelined enqueue"),
+    timeout: float = Option(600, help="Give up after this many seconds"),
+) -> None:
+    asyncio.run(run(orders, enqueue_batch, timeout))
+
+
+if __name__ == "__main__":
+    app()
@@ -1,4 +1,9 @@
 #!/bin/sh
 
 export PYTHONPATH=$(pwd)/src:$PYTHONPATH
-taskiq worker order_worker.taskiq_app:broker
+taskiq worker order_worker.taskiq_app:broker \
+    --workers "${WORKER_PROCESSES:-2}" \
+    --max-async-tasks "${WORKER_CONCURRENCY:-10}" \
+    --max-prefetch "${WORKER_PREFETCH:-10}" \
+    --ack-type when_executed \
+    --wait-tasks-timeout "${WORKER_DRAIN_TIMEOUT_SECONDS:-30}"
@@ -0,0 +1,32 @@
+"""add order user listing index.
+
+Revision ID: 4b7e2d91c3a8
+Revises: 69e23a157c0b
+Create Date: 2026-10-18 11:02:37.214508
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e2d91c3a8"
+down_revision: Union[str, Sequence[str], None] = "69e23a157c0b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_order_user_id_created_at_id",
+        "order",
+        ["user_id", sa.text("created_at DESC"), "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_user_id_created_at_id", table_name="order")
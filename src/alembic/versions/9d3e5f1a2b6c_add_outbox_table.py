@@ -0,0 +1,41 @@
+"""add outbox table.
+
+Revision ID: 9d3e5f1a2b6c
+Revises: 4b7e2d91c3a8
+Create Date: 2026-10-18 14:21:05.118342
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3e5f1a2b6c"
+down_revision: Union[str, Sequence[str], None] = "4b7e2d91c3a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("topic", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_outbox_created_at"),
+        "outbox",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_outbox_created_at"), table_name="outbox")
+    op.drop_table("outbox")
@@ -0,0 +1,31 @@
+"""add outbox trace context.
+
+Revision ID: e5a8c3f27d41
+Revises: 9d3e5f1a2b6c
+Create Date: 2026-10-18 17:42:11.503218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a8c3f27d41"
+down_revision: Union[str, Sequence[str], None] = "9d3e5f1a2b6c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "outbox",
+        sa.Column("trace_context", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("outbox", "trace_context")
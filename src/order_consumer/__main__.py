@@ -6,8 +6,16 @@ from faststream import FastStream
 from faststream.asgi import AsgiResponse
 from faststream.asgi import get
 from faststream.kafka import KafkaBroker
+from order_consumer.metrics import collect_consumer_lag
+from order_consumer.metrics import collect_taskiq_queue_depth
+from order_consumer.metrics import REGISTRY
 from order_consumer.routers.order import router as order_router
 from order_consumer.settings import settings
+from order_service.helpers.metrics import CONTENT_TYPE
+from order_service.helpers.metrics import render_metrics
+from order_service.helpers.tracing import build_span_exporter
+from order_service.helpers.tracing import configure_tracing
+from order_worker.taskiq_app import broker as taskiq_broker
 
 
 @get
@@ -16,7 +24,36 @@ async def liveness(scope: dict[str, Any]) -> AsgiResponse:
     return AsgiResponse(b"", status_code=204)
 
 
-broker = KafkaBroker(settings.broker_url)
+@get
+async def metrics(scope: dict[str, Any]) -> AsgiResponse:
+    """Prometheus metrics: consumer lag and taskiq queue depth."""
+    await collect_consumer_lag(broker)
+    await collect_taskiq_queue_depth(taskiq_broker)
+    return AsgiResponse(
+        render_metrics(REGISTRY),
+        status_code=200,
+        headers={"Content-Type": CONTENT_TYPE},
+    )
+
+
+middlewares = []
+if settings.tracing_enabled:
+    from faststream.kafka.opentelemetry import KafkaTelemetryMiddleware
+
+    tracer_provider = configure_tracing(
+        "order-consumer",
+        build_span_exporter(
+            settings.tracing_exporter,
+            settings.tracing_otlp_endpoint,
+        ),
+        sample_ratio=settings.tracing_sample_ratio,
+    )
+    # Continues the trace from the `traceparent` header of each message
+    middlewares.append(
+        KafkaTelemetryMiddleware(tracer_provider=tracer_provider),
+    )
+
+broker = KafkaBroker(settings.broker_url, middlewares=middlewares)
 broker.include_router(order_router)
 app = FastStream(broker)
 
@@ -24,6 +61,7 @@ app = FastStream(broker)
 async def main() -> None:
     asgi_routes = [
         ("/internal/alive", liveness),
+        ("/metrics", metrics),
     ]
 
     uvicorn_config = uvicorn.Config(
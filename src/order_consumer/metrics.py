@@ -0,0 +1,70 @@
+from aiokafka.errors import KafkaError
+from faststream.kafka import KafkaBroker
+from prometheus_client import Gauge
+from prometheus_client.registry import CollectorRegistry
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from taskiq_redis import RedisStreamBroker
+
+# Kept apart from the API metrics, which this process never records
+REGISTRY = CollectorRegistry()
+
+KAFKA_CONSUMER_LAG = Gauge(
+    "kafka_consumer_lag",
+    "Messages between the consumer position and the high watermark",
+    ("topic", "partition"),
+    registry=REGISTRY,
+)
+TASKIQ_QUEUE_DEPTH = Gauge(
+    "taskiq_queue_depth",
+    "Tasks in the taskiq stream by state: not delivered or not acked yet",
+    ("queue", "state"),
+    registry=REGISTRY,
+)
+
+
+async def collect_consumer_lag(broker: KafkaBroker) -> None:
+    # Partitions move between consumers on rebalance, drop stale ones
+    KAFKA_CONSUMER_LAG.clear()
+    for subscriber in broker.subscribers:
+        consumer = getattr(subscriber, "consumer", None)
+        if consumer is None:
+            continue
+
+        for partition in consumer.assignment():
+            highwater = consumer.highwater(partition)
+            if highwater is None:
+                continue
+            try:
+                position = await consumer.position(partition)
+            except KafkaError:
+                continue
+            KAFKA_CONSUMER_LAG.labels(
+                topic=partition.topic,
+                partition=partition.partition,
+            ).set(highwater - position)
+
+
+async def collect_taskiq_queue_depth(taskiq_broker: RedisStreamBroker) -> None:
+    queue = taskiq_broker.queue_name
+    connection_pool = taskiq_broker.connection_pool
+    try:
+        async with Redis(connection_pool=connection_pool) as redis:
+            groups = await redis.xinfo_groups(queue)
+    except ResponseError:
+        # The stream does not exist until the first task is sent
+        return
+
+    for group in groups:
+        name = group["name"]
+        if isinstance(name, bytes):
+            name = name.decode()
+        if name != taskiq_broker.consumer_group_name:
+            continue
+
+        TASKIQ_QUEUE_DEPTH.labels(queue=queue, state="undelivered").set(
+            group.get("lag") or 0,
+        )
+        TASKIQ_QUEUE_DEPTH.labels(queue=queue, state="pending").set(
+            group["pending"],
+        )
@@ -1,10 +1,67 @@
+import logging
+
 from faststream.kafka import KafkaRouter
+from faststream.kafka.annotations import KafkaMessage
+from faststream.message import StreamMessage
+from faststream.middlewares import AckPolicy
 from order_consumer.schemas import IncomingOrder
+from order_consumer.settings import settings
+from order_service.helpers.tracing import trace_headers
+from order_worker.taskiq_app import broker as taskiq_broker
 from order_worker.tasks import process_incoming_order as process_order_task
+from pydantic import TypeAdapter
+from pydantic import ValidationError
 
 router = KafkaRouter()
 
 
-@router.subscriber("new_order")
-async def process_incoming_order(incoming_order: IncomingOrder) -> None:
-    await process_order_task.kiq(incoming_order.model_dump())
+if settings.order_batch_enabled:
+    incoming_order_adapter = TypeAdapter(IncomingOrder)
+
+    async def decode_raw_batch(message: StreamMessage) -> list[bytes]:
+        # Records are validated one by one in the handler, so a malformed
+        # one can't fail the whole batch and get it redelivered forever
+        return message.body
+
+    @router.subscriber(
+        "new_order",
+        batch=True,
+        max_records=settings.order_batch_max_size,
+        batch_timeout_ms=settings.order_batch_max_wait_ms,
+        group_id=settings.order_consumer_group_id,
+        decoder=decode_raw_batch,
+        # Offsets are committed once per batch, after it is enqueued
+        ack_policy=AckPolicy.NACK_ON_ERROR,
+    )
+    async def process_incoming_orders(
+        payloads: list[bytes],
+        message: KafkaMessage,
+    ) -> None:
+        orders, labels = [], []
+        for payload, headers in zip(payloads, message.batch_headers):
+            try:
+                order = incoming_order_adapter.validate_json(payload)
+            except ValidationError as exc:
+                logging.warning(
+                    "Skipping malformed order message %r: %s",
+                    payload[:200],
+                    exc,
+                )
+                continue
+
+            orders.append(order.model_dump())
+            # Each job continues the trace of its own order, not of the batch
+            labels.append(trace_headers(headers))
+
+        if orders:
+            await taskiq_broker.kiq_batch(
+                process_order_task,
+                orders,
+                labels=labels,
+            )
+
+else:
+
+    @router.subscriber("new_order")
+    async def process_incoming_order(incoming_order: IncomingOrder) -> None:
+        await process_order_task.kiq(incoming_order.model_dump())
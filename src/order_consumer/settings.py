@@ -1,8 +1,19 @@
+from order_service.settings import TracingExporter
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     broker_url: str = "kafka:9092"
 
+    order_batch_enabled: bool = False
+    order_batch_max_size: int = 500
+    order_batch_max_wait_ms: int = 200
+    order_consumer_group_id: str = "order_consumer"
+
+    tracing_enabled: bool = False
+    tracing_exporter: TracingExporter = "otlp"
+    tracing_otlp_endpoint: str = "http://otel-collector:4318"
+    tracing_sample_ratio: float = 1.0
+
 
 settings = Settings()
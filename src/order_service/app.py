@@ -1,20 +1,40 @@
 import logging
 from collections.abc import AsyncGenerator
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from faststream.kafka.broker import KafkaBroker
+from order_service.helpers.db_pool import InstrumentedAsyncPool
+from order_service.helpers.db_pool import track_query_durations
+from order_service.helpers.hashing import PasswordHashingPool
+from order_service.helpers.kafka import KafkaEventPublisher
+from order_service.helpers.metrics import RequestMetricsMiddleware
+from order_service.helpers.order_cache import CacheTierStats
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.helpers.order_cache import OrderCacheInvalidationListener
+from order_service.helpers.rate_limit import RateLimit
+from order_service.helpers.rate_limit import RateLimiter
+from order_service.helpers.redis_client import InstrumentedRedis
+from order_service.helpers.single_flight import SingleFlight
+from order_service.helpers.token_cache import TokenCache
+from order_service.helpers.tracing import build_span_exporter
+from order_service.helpers.tracing import configure_tracing
+from order_service.helpers.tracing import trace_queries
+from order_service.helpers.tracing import TracingMiddleware
+from order_service.repos.order import OrderCacheScripts
 from order_service.routers.auth import router as auth_router
+from order_service.routers.internal import router as internal_router
+from order_service.routers.metrics import router as metrics_router
 from order_service.routers.order import router as order_router
+from order_service.services.outbox import OutboxRelay
 from order_service.settings import Settings
 from redis.asyncio import ConnectionPool
-from slowapi import _rate_limit_exceeded_handler
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
 from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
 
 
@@ -37,15 +57,65 @@ async def init_redis_pool(app_instance: FastAPI) -> None:
         retry_on_timeout=True,
     )
     app_instance.state.redis_connection_pool = conn_pool
+    app_instance.state.redis = InstrumentedRedis(connection_pool=conn_pool)
+
+
+def setup_tracing(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    app_instance.state.tracer_provider = None
+    if not settings.tracing_enabled:
+        return
+
+    # Kept on the state so tests can read the spans of a `memory` exporter
+    exporter = build_span_exporter(
+        settings.tracing_exporter,
+        settings.tracing_otlp_endpoint,
+    )
+    app_instance.state.span_exporter = exporter
+    app_instance.state.tracer_provider = configure_tracing(
+        "order-service",
+        exporter,
+        sample_ratio=settings.tracing_sample_ratio,
+    )
 
 
 async def setup_kafka(app_instance: FastAPI) -> None:
     settings: Settings = app_instance.state.settings
-    broker = KafkaBroker(settings.broker_url)
+    tracer_provider = app_instance.state.tracer_provider
+    middlewares = []
+    if tracer_provider is not None:
+        from faststream.kafka.opentelemetry import KafkaTelemetryMiddleware
+
+        middlewares.append(
+            KafkaTelemetryMiddleware(tracer_provider=tracer_provider),
+        )
+
+    acks = settings.kafka_acks
+    broker = KafkaBroker(
+        settings.broker_url,
+        middlewares=middlewares,
+        acks=acks if acks == "all" else int(acks),
+        enable_idempotence=settings.kafka_enable_idempotence,
+        linger_ms=settings.kafka_linger_ms,
+        max_batch_size=settings.kafka_max_batch_size,
+        compression_type=settings.kafka_compression_type,
+    )
 
     await broker.start()
 
+    if settings.kafka_publish_mode == "fire_and_forget":
+        logging.warning(
+            "KAFKA_PUBLISH_MODE=fire_and_forget: outbox events whose "
+            "publish fails are retried after newer ones, so consumers may "
+            "see them out of order"
+        )
+
     app_instance.state.broker = broker
+    app_instance.state.event_publisher = KafkaEventPublisher(
+        broker,
+        max_in_flight=settings.kafka_max_in_flight,
+        confirm=settings.kafka_publish_mode == "confirm",
+    )
 
 
 async def setup_db_engine(app_instance: FastAPI) -> None:
@@ -59,9 +129,112 @@ async def setup_db_engine(app_instance: FastAPI) -> None:
         port=settings.db_port,
         database=settings.db_name,
     )
-    engine = create_async_engine(uri)
+    connect_args = {}
+    if settings.db_driver.endswith("+asyncpg"):
+        connect_args["prepared_statement_cache_size"] = (
+            settings.db_prepared_statement_cache_size
+        )
+
+    engine = create_async_engine(
+        uri,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+    track_query_durations(engine)
+    if settings.tracing_enabled:
+        trace_queries(engine)
 
     app_instance.state.engine = engine
+    app_instance.state.session_maker = async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+    )
+
+
+def setup_outbox_relay(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    relay = OutboxRelay(
+        session_maker=app_instance.state.session_maker,
+        publisher=app_instance.state.event_publisher,
+        batch_size=settings.outbox_batch_size,
+        poll_interval_seconds=settings.outbox_poll_interval_seconds,
+    )
+    if settings.outbox_relay_enabled:
+        relay.start()
+
+    app_instance.state.outbox_relay = relay
+
+
+def setup_password_hashing(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    executor: Executor
+    if settings.password_hashing_executor == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=settings.password_hashing_workers,
+        )
+    else:
+        executor = ThreadPoolExecutor(
+            max_workers=settings.password_hashing_workers,
+            thread_name_prefix="password-hashing",
+        )
+
+    app_instance.state.password_hashing_pool = PasswordHashingPool(
+        executor,
+        max_concurrency=settings.password_hashing_workers,
+        max_queue_size=settings.password_hashing_max_queue_size,
+    )
+
+
+def setup_token_cache(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    app_instance.state.token_cache = TokenCache(
+        max_size=settings.jwt_cache_max_size,
+        ttl_seconds=settings.jwt_cache_ttl_seconds,
+    )
+
+
+def setup_order_cache(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    local_cache = LocalOrderCache(
+        max_size=settings.order_local_cache_max_size,
+        # The local copy must never outlive the Redis one
+        ttl_seconds=min(
+            settings.order_local_cache_ttl_seconds,
+            settings.order_cache_ttl_seconds,
+        ),
+    )
+    listener = OrderCacheInvalidationListener(
+        app_instance.state.redis,
+        local_cache,
+    )
+    listener.start()
+
+    app_instance.state.order_local_cache = local_cache
+    app_instance.state.order_redis_cache_stats = CacheTierStats("redis")
+    app_instance.state.order_single_flight = SingleFlight()
+    app_instance.state.order_cache_listener = listener
+    app_instance.state.order_cache_scripts = OrderCacheScripts.register(
+        app_instance.state.redis,
+    )
+
+
+def setup_rate_limiter(app_instance: FastAPI) -> None:
+    settings: Settings = app_instance.state.settings
+    app_instance.state.rate_limiter = RateLimiter(
+        app_instance.state.redis,
+        limits={
+            "read": RateLimit.parse(settings.rate_limit_read),
+            "write": RateLimit.parse(settings.rate_limit_write),
+            "auth": RateLimit.parse(settings.rate_limit_auth),
+            "ip": RateLimit.parse(settings.rate_limit_ip),
+        },
+        timeout_seconds=settings.rate_limit_redis_timeout_ms / 1000,
+    )
 
 
 def setup_logging(app_instance: FastAPI) -> None:
@@ -77,26 +250,56 @@ async def remove_engine(app_instance: FastAPI) -> None:
 
 
 async def remove_redis_connection_pool(app_instance: FastAPI) -> None:
+    await app_instance.state.redis.aclose()
     await app_instance.state.redis_connection_pool.disconnect(
         inuse_connections=True,
     )
 
 
+async def remove_outbox_relay(app_instance: FastAPI) -> None:
+    await app_instance.state.outbox_relay.stop()
+
+
 async def remove_broker(app_instance: FastAPI) -> None:
+    await app_instance.state.event_publisher.flush()
     await app_instance.state.broker.close()
 
 
+async def remove_order_cache(app_instance: FastAPI) -> None:
+    await app_instance.state.order_cache_listener.stop()
+
+
+def remove_password_hashing(app_instance: FastAPI) -> None:
+    app_instance.state.password_hashing_pool.shutdown()
+
+
+def remove_tracing(app_instance: FastAPI) -> None:
+    # Exports the spans still buffered by the batch processor
+    if app_instance.state.tracer_provider is not None:
+        app_instance.state.tracer_provider.shutdown()
+
+
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI) -> AsyncGenerator:
     load_settings(app_instance)
     setup_logging(app_instance)
+    setup_tracing(app_instance)
     await setup_kafka(app_instance)
     await setup_db_engine(app_instance)
     await init_redis_pool(app_instance)
+    setup_password_hashing(app_instance)
+    setup_token_cache(app_instance)
+    setup_order_cache(app_instance)
+    setup_rate_limiter(app_instance)
+    setup_outbox_relay(app_instance)
     yield
+    await remove_outbox_relay(app_instance)
+    await remove_order_cache(app_instance)
     await remove_broker(app_instance)
     await remove_engine(app_instance)
     await remove_redis_connection_pool(app_instance)
+    remove_password_hashing(app_instance)
+    remove_tracing(app_instance)
 
 
 def build_app() -> FastAPI:
@@ -116,16 +319,13 @@ def build_app() -> FastAPI:
         allow_methods=settings.cors_allow_methods,
         allow_headers=settings.cors_allow_headers,
     )
-
-    limiter = Limiter(
-        key_func=get_remote_address,
-        default_limits=[settings.slowapi_ratelimit],
-    )
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-    app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(RequestMetricsMiddleware)
+    if settings.tracing_enabled:
+        app.add_middleware(TracingMiddleware)
 
     app.include_router(order_router)
     app.include_router(auth_router)
+    app.include_router(internal_router)
+    app.include_router(metrics_router)
 
     return app
@@ -1,30 +1,45 @@
+import hmac
+
 from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
 from fastapi.security import OAuth2PasswordBearer
+from order_service.dependencies.common import get_password_hashing_pool
 from order_service.dependencies.common import get_session
 from order_service.dependencies.common import get_settings
+from order_service.dependencies.common import get_token_cache
+from order_service.dto.user import CurrentUserDTO
+from order_service.errors.auth import InvalidInternalTokenError
 from order_service.helpers.auth import AuthHelper
+from order_service.helpers.hashing import PasswordHashingPool
+from order_service.helpers.token_cache import TokenCache
 from order_service.repos.user import UserRepository
 from order_service.services.auth import AuthService
 from order_service.settings import Settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.order_service.dto.user import CurrentUserDTO
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
+internal_token_scheme = HTTPBearer(auto_error=False)
 
 
 def get_user_repository(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session, scope="function"),
 ) -> UserRepository:
     return UserRepository(session)
 
 
-def get_auth_helper(settings: Settings = Depends(get_settings)) -> AuthHelper:
+def get_auth_helper(
+    settings: Settings = Depends(get_settings),
+    hashing_pool: PasswordHashingPool = Depends(get_password_hashing_pool),
+    token_cache: TokenCache = Depends(get_token_cache),
+) -> AuthHelper:
     return AuthHelper(
         secret_key=settings.jwt_secret_key,
         hashing_algorithm=settings.jwt_hashing_algorithm,
         access_token_exp=settings.jwt_access_token_expiration_minutes,
         refresh_token_exp=settings.jwt_refresh_token_expiration_minutes,
+        hashing_pool=hashing_pool,
+        token_cache=token_cache,
     )
 
 
@@ -37,8 +52,25 @@ def get_auth_service(
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_helper: AuthHelper = Depends(get_auth_helper),
 ) -> CurrentUserDTO:
-    current_user = auth_service.get_current_user(token)
+    # Tokens are self-contained, so validation must not touch the database
+    current_user = auth_helper.extract_current_user(token)
 
     return current_user
+
+
+def require_internal_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(
+        internal_token_scheme,
+    ),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    # Operational endpoints share the public port, so they need a secret
+    expected = settings.internal_api_token
+    if (
+        not expected
+        or credentials is None
+        or not hmac.compare_digest(credentials.credentials, expected)
+    ):
+        raise InvalidInternalTokenError()
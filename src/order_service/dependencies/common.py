@@ -4,8 +4,15 @@ from typing import Any
 
 from fastapi import Depends
 from fastapi import Request
-from faststream.kafka import KafkaBroker
 from order_service.errors.common import FastApiError
+from order_service.helpers.hashing import PasswordHashingPool
+from order_service.helpers.order_cache import CacheTierStats
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.helpers.rate_limit import RateLimiter
+from order_service.helpers.single_flight import SingleFlight
+from order_service.helpers.token_cache import TokenCache
+from order_service.repos.base import run_after_commit
+from order_service.repos.order import OrderCacheScripts
 from order_service.settings import Settings
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -17,22 +24,43 @@ def get_settings(request: Request) -> Settings:
 
 
 def get_session_maker(request: Request) -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(
-        bind=request.app.state.engine,
-        expire_on_commit=False,
-    )
+    return request.app.state.session_maker
 
 
 def get_redis(request: Request) -> Redis:
-    pool = request.app.state.redis_connection_pool
+    return request.app.state.redis
 
-    return Redis(connection_pool=pool)
 
+def get_password_hashing_pool(request: Request) -> PasswordHashingPool:
+    return request.app.state.password_hashing_pool
 
-def get_broker(request: Request) -> KafkaBroker:
-    return request.app.state.broker
 
+def get_token_cache(request: Request) -> TokenCache:
+    return request.app.state.token_cache
 
+
+def get_order_local_cache(request: Request) -> LocalOrderCache:
+    return request.app.state.order_local_cache
+
+
+def get_order_redis_cache_stats(request: Request) -> CacheTierStats:
+    return request.app.state.order_redis_cache_stats
+
+
+def get_order_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.order_single_flight
+
+
+def get_order_cache_scripts(request: Request) -> OrderCacheScripts:
+    return request.app.state.order_cache_scripts
+
+
+def get_rate_limiter(request: Request) -> RateLimiter:
+    return request.app.state.rate_limiter
+
+
+# Depend on it with `scope="function"`: in the default request scope the
+# commit and the after-commit callbacks would run after the response is sent
 async def get_session(
     session_maker: async_sessionmaker[AsyncSession] = Depends(
         get_session_maker,
@@ -42,6 +70,7 @@ async def get_session(
     try:
         yield session
         await session.commit()
+        await run_after_commit(session)
     except FastApiError as error:
         await session.rollback()
         raise error
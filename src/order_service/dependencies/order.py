@@ -1,30 +1,63 @@
 from fastapi import Depends
-from faststream.kafka import KafkaBroker
-from order_service.dependencies.common import get_broker
+from order_service.dependencies.common import get_order_cache_scripts
+from order_service.dependencies.common import get_order_local_cache
+from order_service.dependencies.common import get_order_redis_cache_stats
+from order_service.dependencies.common import get_order_single_flight
 from order_service.dependencies.common import get_redis
 from order_service.dependencies.common import get_session
+from order_service.dependencies.common import get_session_maker
 from order_service.dependencies.common import get_settings
+from order_service.helpers.order_cache import CacheTierStats
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.helpers.order_codec import get_order_codec
+from order_service.helpers.single_flight import SingleFlight
+from order_service.repos.order import OrderCacheScripts
 from order_service.repos.order import OrderRepository
+from order_service.repos.outbox import OutboxRepository
 from order_service.services.order import OrderService
 from order_service.settings import Settings
 from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def get_order_repo(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_session, scope="function"),
     redis: Redis = Depends(get_redis),
     settings: Settings = Depends(get_settings),
+    local_cache: LocalOrderCache = Depends(get_order_local_cache),
+    redis_cache_stats: CacheTierStats = Depends(get_order_redis_cache_stats),
+    single_flight: SingleFlight = Depends(get_order_single_flight),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(
+        get_session_maker,
+    ),
+    scripts: OrderCacheScripts = Depends(get_order_cache_scripts),
 ) -> OrderRepository:
     return OrderRepository(
         session,
         redis,
         order_cache_ttl_seconds=settings.order_cache_ttl_seconds,
+        local_cache=local_cache,
+        redis_cache_stats=redis_cache_stats,
+        single_flight=single_flight,
+        session_maker=session_maker,
+        negative_cache_ttl_seconds=settings.order_negative_cache_ttl_seconds,
+        load_lock_ttl_ms=settings.order_cache_load_lock_ttl_ms,
+        early_refresh_beta=settings.order_cache_early_refresh_beta,
+        cache_codec=get_order_codec(settings.order_cache_format),
+        listing_cache_ttl_seconds=settings.order_listing_cache_ttl_seconds,
+        scripts=scripts,
     )
 
 
+def get_outbox_repo(
+    session: AsyncSession = Depends(get_session, scope="function"),
+) -> OutboxRepository:
+    return OutboxRepository(session)
+
+
 def get_order_service(
     order_repo: OrderRepository = Depends(get_order_repo),
-    broker: KafkaBroker = Depends(get_broker),
+    outbox_repo: OutboxRepository = Depends(get_outbox_repo),
 ) -> OrderService:
-    return OrderService(order_repo, broker)
+    return OrderService(order_repo, outbox_repo)
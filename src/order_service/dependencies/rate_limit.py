@@ -0,0 +1,53 @@
+from fastapi import Depends
+from fastapi import Request
+from order_service.dependencies.auth import get_current_user
+from order_service.dependencies.common import get_rate_limiter
+from order_service.dto.user import CurrentUserDTO
+from order_service.errors.common import RateLimitExceededError
+from order_service.helpers.rate_limit import RateLimiter
+
+
+async def _check_rate_limit(
+    request: Request,
+    rate_limiter: RateLimiter,
+    scope: str,
+    user_id: str | None = None,
+) -> None:
+    # Behind a proxy this is the real client only when uvicorn trusts it,
+    # see `FORWARDED_ALLOW_IPS`
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = await rate_limiter.check(scope, client_ip, user_id)
+    if retry_after:
+        raise RateLimitExceededError(retry_after)
+
+
+async def limit_by_ip(
+    request: Request,
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+    # Runs ahead of authentication, so requests with a missing or invalid
+    # token are counted too
+    await _check_rate_limit(request, rate_limiter, "ip")
+
+
+async def limit_reads(
+    request: Request,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+    await _check_rate_limit(request, rate_limiter, "read", current_user.id)
+
+
+async def limit_writes(
+    request: Request,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+    await _check_rate_limit(request, rate_limiter, "write", current_user.id)
+
+
+async def limit_auth(
+    request: Request,
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
+) -> None:
+    await _check_rate_limit(request, rate_limiter, "auth")
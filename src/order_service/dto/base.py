@@ -21,3 +21,14 @@ class PageDTO(
     total_pages: int
     total_items: int
     page: int
+
+
+@dataclass
+class CursorPageDTO(
+    BaseDTO,
+    Generic[T],
+):
+    items: list[T]
+    page_size: int
+    next_cursor: str | None
+    total_items: int | None = None
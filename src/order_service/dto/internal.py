@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from order_service.dto.base import BaseDTO
+
+
+@dataclass
+class DbPoolStatsDTO(BaseDTO):
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+
+
+@dataclass
+class OrderCacheStatsDTO(BaseDTO):
+    local_size: int
+    local_hits: int
+    local_misses: int
+    local_hit_ratio: float
+    redis_hits: int
+    redis_misses: int
+    redis_hit_ratio: float
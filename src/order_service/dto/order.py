@@ -16,6 +16,13 @@ class OrderDTO(BaseDTO):
     order_price: float
 
 
+@dataclass
+class CachedOrderDTO(BaseDTO):
+    order: OrderDTO | None
+    ttl_ms: int
+    load_ms: float | None = None
+
+
 @dataclass
 class OrderCreateDTO(BaseDTO):
     items: dict
@@ -23,10 +30,29 @@ class OrderCreateDTO(BaseDTO):
     current_user: CurrentUserDTO
 
 
+@dataclass
+class OrderCreateItemDTO(BaseDTO):
+    items: dict
+    order_price: float
+
+
+@dataclass
+class OrdersBulkCreateDTO(BaseDTO):
+    orders: list[OrderCreateItemDTO]
+    current_user: CurrentUserDTO
+
+
 @dataclass
 class UpdateOrderStatusDTO(BaseDTO):
     status: OrderStatus
-    order: OrderDTO
+    order_id: str
+    current_user: CurrentUserDTO
+    expected_status: OrderStatus | None = None
+
+
+@dataclass
+class OrdersBatchFetchRequestDTO(BaseDTO):
+    order_ids: list[str]
     current_user: CurrentUserDTO
 
 
@@ -35,3 +61,11 @@ class OrdersFetchRequestDTO(BaseDTO):
     page: int
     page_size: int
     user_id: str
+
+
+@dataclass
+class OrdersCursorFetchRequestDTO(BaseDTO):
+    cursor: str | None
+    page_size: int
+    user_id: str
+    with_total: bool = False
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from order_service.dto.base import BaseDTO
+
+
+@dataclass
+class OutboxEventDTO(BaseDTO):
+    id: str
+    topic: str
+    payload: dict
+    trace_context: dict[str, str] | None = None
@@ -6,3 +6,23 @@ class OrderStatus(StrEnum):
     PAID = "PAID"
     SHIPPED = "SHIPPED"
     CANCELED = "CANCELED"
+
+    @property
+    def previous_statuses(self) -> frozenset["OrderStatus"]:
+        return frozenset(
+            status
+            for status, allowed in ORDER_STATUS_TRANSITIONS.items()
+            if self in allowed
+        )
+
+    def can_transition_to(self, new_status: "OrderStatus") -> bool:
+        return new_status in ORDER_STATUS_TRANSITIONS[self]
+
+
+# Allowed `status -> new status` moves; anything else is a conflict
+ORDER_STATUS_TRANSITIONS: dict[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.PENDING: frozenset({OrderStatus.PAID, OrderStatus.CANCELED}),
+    OrderStatus.PAID: frozenset({OrderStatus.SHIPPED, OrderStatus.CANCELED}),
+    OrderStatus.SHIPPED: frozenset(),
+    OrderStatus.CANCELED: frozenset(),
+}
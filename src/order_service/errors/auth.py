@@ -1,5 +1,6 @@
 from order_service.errors.common import InvalidData
 from order_service.errors.common import NotAllowedError
+from order_service.errors.common import TooManyRequests
 
 
 class UserAlreadyExistsError(InvalidData):
@@ -20,3 +21,11 @@ class InvalidAuthorizationScheme(InvalidData):
 
 class ExpiredTokenError(NotAllowedError):
     message = "Expired token"
+
+
+class InvalidInternalTokenError(NotAllowedError):
+    message = "Missing or invalid internal API token"
+
+
+class PasswordHashingOverloadedError(TooManyRequests):
+    message = "Too many authentication requests, retry later"
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import HTTPException
 from fastapi import status
 
@@ -40,3 +42,21 @@ class RemoteServerError(FastApiError):
 class TooManyRequests(FastApiError):
     status_code = status.HTTP_429_TOO_MANY_REQUESTS
     message = "Too many requests"
+
+
+class RateLimitExceededError(TooManyRequests):
+    message = "Rate limit exceeded"
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        retry_after = max(1, math.ceil(retry_after_seconds))
+        super().__init__(retry_after=retry_after)
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+class InvalidCursorError(InvalidData):
+    message = "Invalid pagination cursor"
+
+
+class ConflictError(FastApiError):
+    status_code = status.HTTP_409_CONFLICT
+    message = "Conflicting update, retry later"
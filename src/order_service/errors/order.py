@@ -0,0 +1,5 @@
+from order_service.errors.common import ConflictError
+
+
+class OrderStatusConflictError(ConflictError):
+    message = "Order status has changed or does not allow this transition"
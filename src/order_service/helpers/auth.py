@@ -2,11 +2,13 @@ import datetime
 from typing import Any
 from typing import Literal
 
-import bcrypt
 import jwt
 from order_service.dto.auth import TokenPairDTO
+from order_service.dto.user import CurrentUserDTO
 from order_service.errors.auth import ExpiredTokenError
 from order_service.errors.auth import InvalidAuthorizationScheme
+from order_service.helpers.hashing import PasswordHashingPool
+from order_service.helpers.token_cache import TokenCache
 
 
 class AuthHelper:
@@ -16,20 +18,28 @@ class AuthHelper:
         hashing_algorithm: str,
         access_token_exp: int,
         refresh_token_exp: int,
+        hashing_pool: PasswordHashingPool,
+        token_cache: TokenCache | None = None,
     ) -> None:
         self._secret_key = secret_key
         self._hashing_algorithm = hashing_algorithm
         self._access_token_exp_minutes = access_token_exp
         self._refresh_token_exp_minutes = refresh_token_exp
+        self._hashing_pool = hashing_pool
+        self._token_cache = token_cache
 
-    @staticmethod
-    def hash_password(password: str) -> str:
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode(), salt)
-        return hashed_password.decode()
+    async def hash_password(self, password: str) -> str:
+        return await self._hashing_pool.hash_password(password)
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode(), hashed_password.encode())
+    async def verify_password(
+        self,
+        password: str,
+        hashed_password: str,
+    ) -> bool:
+        return await self._hashing_pool.verify_password(
+            password,
+            hashed_password,
+        )
 
     def create_token_pair(
         self,
@@ -70,7 +80,12 @@ class AuthHelper:
     def extract_token_payload(
         self,
         token: str,
-    ) -> dict[str, str]:
+    ) -> dict[str, Any]:
+        if self._token_cache is not None:
+            cached = self._token_cache.get(token)
+            if cached is not None:
+                return cached
+
         try:
             payload = jwt.decode(
                 token, self._secret_key, algorithms=[self._hashing_algorithm]
@@ -80,8 +95,19 @@ class AuthHelper:
         except jwt.InvalidTokenError:
             raise InvalidAuthorizationScheme("Token is invalid.")
 
+        if self._token_cache is not None:
+            self._token_cache.set(token, payload)
+
         return payload
 
+    def extract_current_user(self, token: str) -> CurrentUserDTO:
+        token_payload = self.extract_token_payload(token)
+
+        return CurrentUserDTO(
+            email=token_payload["email"],
+            id=token_payload["uid"],
+        )
+
     def _build_token_payload(
         self,
         scope: Literal["access", "refresh"],
@@ -0,0 +1,62 @@
+import time
+from typing import Any
+
+from order_service.dto.internal import DbPoolStatsDTO
+from order_service.helpers.metrics import DB_POOL_CHECKOUT_WAIT
+from order_service.helpers.metrics import DB_QUERY_DURATION
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import ConnectionPoolEntry
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._checkouts = 0
+        self._checkout_wait_seconds_total = 0.0
+        self._checkout_wait_seconds_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            DB_POOL_CHECKOUT_WAIT.observe(waited)
+            self._checkouts += 1
+            self._checkout_wait_seconds_total += waited
+            self._checkout_wait_seconds_max = max(
+                self._checkout_wait_seconds_max,
+                waited,
+            )
+
+    def stats(self) -> DbPoolStatsDTO:
+        return DbPoolStatsDTO(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self._checkouts,
+            checkout_wait_seconds_total=self._checkout_wait_seconds_total,
+            checkout_wait_seconds_max=self._checkout_wait_seconds_max,
+        )
+
+
+QUERY_STATEMENTS = frozenset(("select", "insert", "update", "delete"))
+
+
+def track_query_durations(engine: AsyncEngine) -> None:
+    """Records `DB_QUERY_DURATION` of every statement run by `engine`"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args: Any) -> None:
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, *args: Any) -> None:
+        verb = statement.lstrip()[:6].lower()
+        DB_QUERY_DURATION.labels(
+            statement=verb if verb in QUERY_STATEMENTS else "other",
+        ).observe(time.perf_counter() - conn.info.pop("query_started"))
@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+from typing import TypeVar
+
+import bcrypt
+from order_service.errors.auth import PasswordHashingOverloadedError
+from order_service.helpers.metrics import PASSWORD_HASHING_DURATION
+from order_service.helpers.metrics import PASSWORD_HASHING_QUEUE_WAIT
+
+R = TypeVar("R")
+
+
+def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt()
+    hashed_password = bcrypt.hashpw(password.encode(), salt)
+    return hashed_password.decode()
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt off the event loop.
+
+    At most `max_concurrency` jobs run in the executor at once and at most
+    `max_queue_size` wait for a free slot; anything above is rejected with 429
+    instead of piling up behind a login storm.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_concurrency: int,
+        max_queue_size: int,
+    ) -> None:
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_queue_size = max_queue_size
+        self._queue_depth = 0
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue_depth
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify_password(
+        self,
+        password: str,
+        hashed_password: str,
+    ) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., R], *args: Any) -> R:
+        if self._queue_depth >= self._max_queue_size:
+            raise PasswordHashingOverloadedError()
+
+        self._queue_depth += 1
+        try:
+            with PASSWORD_HASHING_QUEUE_WAIT.time():
+                await self._semaphore.acquire()
+        finally:
+            self._queue_depth -= 1
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            duration = PASSWORD_HASHING_DURATION.labels(operation=fn.__name__)
+            with duration.time():
+                return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from functools import partial
+from typing import Any
+
+from faststream.kafka import KafkaBroker
+from order_service.helpers.metrics import KAFKA_PUBLISH_DURATION
+from order_service.helpers.tracing import use_context
+
+# Topic, message and the trace context to publish it under
+OutgoingEvent = tuple[str, dict[str, Any], dict[str, str] | None]
+
+
+class KafkaEventPublisher:
+    """
+    Pipelines publishes instead of awaiting a broker ack per message.
+
+    Messages are handed to the producer with `no_confirm=True`, so the
+    producer batches them (see `linger_ms`/`max_batch_size`). At most
+    `max_in_flight` messages wait for an ack; further publishes block, which
+    is the backpressure on callers. In `confirm` mode `publish_many` returns
+    once every message is acked and raises if any failed; otherwise it
+    returns as soon as the messages are queued, and the caller decides what
+    to do with the returned ack futures.
+
+    Each message is published under the trace context it was queued with,
+    so a traced broker continues the trace of the request that created it.
+    """
+
+    def __init__(
+        self,
+        kafka_broker: KafkaBroker,
+        max_in_flight: int,
+        confirm: bool = True,
+    ) -> None:
+        self._broker = kafka_broker
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._confirm = confirm
+        self._pending: set[asyncio.Future] = set()
+
+    @property
+    def confirm(self) -> bool:
+        return self._confirm
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def publish_many(
+        self,
+        messages: Iterable[OutgoingEvent],
+    ) -> list[asyncio.Future]:
+        """
+        :param messages: Messages to publish, in order
+        :return: One ack future per message, in the same order
+        """
+        futures = []
+        for topic, message, trace_context in messages:
+            await self._slots.acquire()
+            started = time.perf_counter()
+            try:
+                with use_context(trace_context):
+                    future = await self._broker.publish(
+                        message,
+                        topic=topic,
+                        no_confirm=True,
+                    )
+            except Exception:
+                self._slots.release()
+                raise
+
+            self._pending.add(future)
+            future.add_done_callback(partial(self._on_done, topic, started))
+            futures.append(future)
+
+        if self._confirm:
+            await asyncio.gather(*futures)
+        return futures
+
+    async def flush(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _on_done(
+        self,
+        topic: str,
+        started: float,
+        future: asyncio.Future,
+    ) -> None:
+        self._pending.discard(future)
+        self._slots.release()
+        failed = future.cancelled() or future.exception() is not None
+        KAFKA_PUBLISH_DURATION.labels(
+            topic=topic,
+            result="error" if failed else "ok",
+        ).observe(time.perf_counter() - started)
+        if not self._confirm and not future.cancelled() and future.exception():
+            logging.error(
+                msg="Kafka publish failed",
+                exc_info=future.exception(),
+            )
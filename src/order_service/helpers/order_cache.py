@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from order_service.dto.order import OrderDTO
+from order_service.helpers.metrics import ORDER_CACHE_LOOKUPS
+from redis.asyncio import Redis
+
+ORDER_INVALIDATION_CHANNEL = "order-cache-invalidation"
+
+
+class CacheTierStats:
+    def __init__(self, tier: str) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = ORDER_CACHE_LOOKUPS.labels(tier=tier, result="hit")
+        self._miss_counter = ORDER_CACHE_LOOKUPS.labels(
+            tier=tier,
+            result="miss",
+        )
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+            self._hit_counter.inc()
+        else:
+            self.misses += 1
+            self._miss_counter.inc()
+
+
+class LocalOrderCache:
+    """
+    Process-local LRU of orders in front of the Redis order cache.
+
+    Entries live for `ttl_seconds` at most; writes made anywhere drop them
+    sooner through `OrderCacheInvalidationListener`. `origin` tags the
+    invalidations this process publishes so it can skip its own.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.origin = uuid.uuid4().hex
+        self.stats = CacheTierStats("local")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, OrderDTO]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, order_id: str) -> OrderDTO | None:
+        entry = self._entries.get(order_id)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(order_id, None)
+            self.stats.record(hit=False)
+            return None
+
+        self._entries.move_to_end(order_id)
+        self.stats.record(hit=True)
+        return entry[1]
+
+    def set(self, order: OrderDTO) -> None:
+        if self._max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + self._ttl_seconds
+        self._entries[order.id] = (expires_at, order)
+        self._entries.move_to_end(order.id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, order_ids: Iterable[str]) -> None:
+        for order_id in order_ids:
+            self._entries.pop(order_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def encode_invalidation(origin: str, order_ids: Iterable[str]) -> str:
+    return " ".join((origin, *order_ids))
+
+
+def decode_invalidation(message: str) -> tuple[str, list[str]]:
+    origin, *order_ids = message.split(" ")
+    return origin, order_ids
+
+
+class OrderCacheInvalidationListener:
+    """
+    Drops local entries for orders that were written by other processes.
+
+    Invalidations published while the subscription is down are lost, so
+    the whole local cache is cleared on every (re)subscribe.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        local_cache: LocalOrderCache,
+        channel: str = ORDER_INVALIDATION_CHANNEL,
+        retry_interval_seconds: float = 1.0,
+    ) -> None:
+        self._redis = redis
+        self._local_cache = local_cache
+        self._channel = channel
+        self._retry_interval_seconds = retry_interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(
+            self._run(),
+            name="order-cache-invalidation",
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def handle(self, message: str | bytes) -> None:
+        if isinstance(message, bytes):
+            message = message.decode()
+
+        origin, order_ids = decode_invalidation(message)
+        if origin != self._local_cache.origin:
+            self._local_cache.invalidate(order_ids)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except Exception as error:
+                logging.error(
+                    msg="Order cache invalidation listener failed",
+                    exc_info=error,
+                )
+                await asyncio.sleep(self._retry_interval_seconds)
+
+    async def _listen(self) -> None:
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(self._channel)
+            self._local_cache.clear()
+            while True:
+                # A bounded wait keeps clear of the pool's socket timeout
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=1.0,
+                )
+                if message is not None:
+                    self.handle(message["data"])
@@ -0,0 +1,123 @@
+import dataclasses
+from datetime import datetime
+from typing import TypeVar
+
+from order_service.dto.base import CursorPageDTO
+from order_service.dto.base import PageDTO
+from order_service.dto.order import OrderDTO
+from order_service.enums.order import OrderStatus
+from pydantic_core import from_json
+from pydantic_core import to_json
+
+# A cached "no such order" in the string layout
+MISSING_ORDER_MARKER = "0"
+
+OrderPage = PageDTO[OrderDTO] | CursorPageDTO[OrderDTO]
+P = TypeVar("P", PageDTO[OrderDTO], CursorPageDTO[OrderDTO])
+
+
+class OrderCacheCodec:
+    """
+    Encodes a cached order as a single Redis string.
+
+    Every value starts with the codec's one character `version`, so readers
+    can decode values written by any registered codec while a new one is
+    rolled out. Values stay text because the Redis clients decode responses.
+    """
+
+    version: str
+
+    def encode(self, order: OrderDTO, load_ms: float | None = None) -> str:
+        raise NotImplementedError
+
+    def decode(self, value: str) -> tuple[OrderDTO, float | None]:
+        raise NotImplementedError
+
+
+class JsonOrderCodec(OrderCacheCodec):
+    """Positional JSON array, parsed in one pass by `pydantic_core`."""
+
+    version = "1"
+
+    def encode(self, order: OrderDTO, load_ms: float | None = None) -> str:
+        return self.version + to_json(self.to_row(order, load_ms)).decode()
+
+    def decode(self, value: str) -> tuple[OrderDTO, float | None]:
+        return self.from_row(from_json(value[1:]))
+
+    @staticmethod
+    def to_row(order: OrderDTO, load_ms: float | None = None) -> list:
+        return [
+            order.id,
+            order.creator_id,
+            order.status,
+            order.created_at,
+            order.order_price,
+            order.items,
+            load_ms,
+        ]
+
+    @staticmethod
+    def from_row(row: list) -> tuple[OrderDTO, float | None]:
+        (
+            order_id,
+            creator_id,
+            status,
+            created_at,
+            order_price,
+            items,
+            load_ms,
+        ) = row
+        order = OrderDTO(
+            id=order_id,
+            creator_id=creator_id,
+            status=OrderStatus(status),
+            created_at=datetime.fromisoformat(created_at),
+            order_price=order_price,
+            items=items,
+        )
+        return order, load_ms
+
+
+DEFAULT_ORDER_CODEC = JsonOrderCodec()
+ORDER_CACHE_CODECS: dict[str, OrderCacheCodec] = {
+    codec.version: codec for codec in (DEFAULT_ORDER_CODEC,)
+}
+
+
+def get_order_codec(name: str) -> OrderCacheCodec | None:
+    """
+    Resolves the `order_cache_format` setting
+    :param name: `hash` for the legacy per-field layout or a codec name
+    :return: A codec, `None` for the legacy hash layout
+    """
+    if name == "hash":
+        return None
+    if name == "json":
+        return DEFAULT_ORDER_CODEC
+    raise ValueError(f"Unknown order cache format {name!r}")
+
+
+def encode_order_page(page: OrderPage) -> str:
+    """Encodes a listing page, its orders as `JsonOrderCodec` rows"""
+    fields = {
+        field.name: getattr(page, field.name)
+        for field in dataclasses.fields(page)
+        if field.name != "items"
+    }
+    fields["items"] = [JsonOrderCodec.to_row(order) for order in page.items]
+    return JsonOrderCodec.version + to_json(fields).decode()
+
+
+def decode_order_page(value: str, page_type: type[P]) -> P | None:
+    """
+    Decodes a value of `encode_order_page`
+    :return: A page or `None` if it was written in another format
+    """
+    if value[:1] != JsonOrderCodec.version:
+        return None
+
+    fields = from_json(value[1:])
+    rows = fields.pop("items")
+    items = [JsonOrderCodec.from_row(row)[0] for row in rows]
+    return page_type(items=items, **fields)
@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+
+from order_service.errors.common import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        created_at, row_id = json.loads(
+            base64.urlsafe_b64decode(cursor + padding),
+        )
+        decoded_at = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError) as error:
+        raise InvalidCursorError() from error
+
+    # Issued cursors carry the naive timestamps of the column, an aware one
+    # could only be compared after guessing the db's timezone
+    if decoded_at.tzinfo is not None or not isinstance(row_id, str):
+        raise InvalidCursorError()
+    return decoded_at, row_id
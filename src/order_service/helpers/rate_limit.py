@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+# KEYS: one counter prefix per limit; ARGV: `limit, window_ms` per key.
+# Sliding window counter: the previous fixed window is weighted by how much
+# of it still overlaps the sliding one. Either every limit takes the hit or
+# none does; returns 0 when allowed, otherwise milliseconds to wait.
+SLIDING_WINDOW_LUA = """
+local now = redis.call("TIME")
+local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+local counters = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local slot = math.floor(now_ms / window)
+    local left = window - (now_ms - slot * window)
+    local counter = key .. ":" .. slot
+    local previous = tonumber(redis.call("GET", key .. ":" .. (slot - 1)))
+    local current = tonumber(redis.call("GET", counter)) or 0
+    previous = previous or 0
+    local excess = previous * left / window + current + 1 - limit
+    if excess > 0 then
+        local wait = left
+        if current + 1 <= limit then
+            wait = math.ceil(excess * window / previous)
+        end
+        retry_after = math.max(retry_after, wait)
+    end
+    counters[i] = {counter, window * 2}
+end
+if retry_after > 0 then
+    return retry_after
+end
+for _, counter in ipairs(counters) do
+    redis.call("INCR", counter[1])
+    redis.call("PEXPIRE", counter[1], counter[2])
+end
+return 0
+"""
+
+RATE_LIMIT_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window_seconds: int
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """
+        Parses limits such as `30/minute` or `5/second`
+        :param value: `<requests>/<second|minute|hour|day>`
+        :return: Parsed limit
+        """
+        limit, _, period = value.strip().partition("/")
+        period = period.strip().lower().removesuffix("s")
+        if not limit.strip().isdigit() or period not in RATE_LIMIT_PERIODS:
+            raise ValueError(f"Invalid rate limit {value!r}")
+
+        return cls(int(limit), RATE_LIMIT_PERIODS[period])
+
+
+class LocalTokenBucket:
+    """
+    Process-local token buckets, used while Redis is slow or down.
+
+    Every key refills at `limit / window` tokens per second up to `limit`.
+    The limits then apply per process rather than cluster-wide, which is
+    good enough to shed load until Redis answers again.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, limits: list[tuple[str, RateLimit]]) -> float:
+        """
+        Takes a token from every bucket or from none of them
+        :param limits: Bucket keys with their limits
+        :return: `0` when allowed, otherwise seconds to wait
+        """
+        now = time.monotonic()
+        tokens = []
+        retry_after = 0.0
+        for key, rate_limit in limits:
+            rate = rate_limit.limit / rate_limit.window_seconds
+            available, updated_at = self._buckets.get(
+                key,
+                (rate_limit.limit, now),
+            )
+            available = min(
+                rate_limit.limit,
+                available + (now - updated_at) * rate,
+            )
+            if available < 1:
+                retry_after = max(retry_after, (1 - available) / rate)
+            tokens.append((key, available))
+
+        for key, available in tokens:
+            if not retry_after:
+                available -= 1
+            self._buckets[key] = (available, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+
+        return retry_after
+
+
+class RateLimiter:
+    """
+    Cluster-wide request limits kept in Redis.
+
+    Each check is one atomic `SLIDING_WINDOW_LUA` call. When Redis does not
+    answer within `timeout_seconds`, the check falls back to
+    `LocalTokenBucket` so a slow Redis never stalls the API.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        limits: dict[str, RateLimit],
+        timeout_seconds: float,
+        local_max_keys: int = 10_000,
+    ) -> None:
+        self._redis = redis
+        self._limits = limits
+        self._timeout_seconds = timeout_seconds
+        self._local = LocalTokenBucket(local_max_keys)
+        self._degraded = False
+        self._sliding_window = redis.register_script(SLIDING_WINDOW_LUA)
+
+    async def check(
+        self,
+        scope: str,
+        client_ip: str,
+        user_id: str | None = None,
+    ) -> float:
+        """
+        Counts a request against the limits of its scope
+        :param scope: Limit name, e.g. `read` or `write`
+        :param client_ip: Client address
+        :param user_id: Authenticated user, limits by IP when missing
+        :return: `0` when allowed, otherwise seconds to wait
+        """
+        rate_limit = self._limits[scope]
+        if user_id is None:
+            key = f"rate-limit:{scope}:ip:{client_ip}"
+        else:
+            key = f"rate-limit:{scope}:user:{user_id}"
+
+        try:
+            retry_after_ms = await asyncio.wait_for(
+                self._sliding_window(
+                    keys=[key],
+                    args=[rate_limit.limit, rate_limit.window_seconds * 1000],
+                ),
+                timeout=self._timeout_seconds,
+            )
+        except (TimeoutError, RedisError) as error:
+            if not self._degraded:
+                self._degraded = True
+                logging.warning(
+                    msg="Rate limiting falls back to local buckets",
+                    exc_info=error,
+                )
+            return self._local.acquire([(key, rate_limit)])
+
+        if self._degraded:
+            self._degraded = False
+            logging.info(msg="Rate limiting is back on Redis")
+        return retry_after_ms / 1000
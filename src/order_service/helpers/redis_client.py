@@ -0,0 +1,61 @@
+import time
+from typing import Any
+
+from order_service.helpers.metrics import REDIS_COMMAND_DURATION
+from order_service.helpers.tracing import start_span
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        started = time.perf_counter()
+        try:
+            with start_span(
+                "PIPELINE",
+                kind="client",
+                attributes={
+                    "db.system": "redis",
+                    "db.operation": "pipeline",
+                    "db.redis.commands": len(self.command_stack),
+                },
+            ):
+                return await super().execute(raise_on_error)
+        finally:
+            REDIS_COMMAND_DURATION.labels(command="pipeline").observe(
+                time.perf_counter() - started,
+            )
+
+
+class InstrumentedRedis(Redis):
+    """
+    Redis client that records `REDIS_COMMAND_DURATION` per round trip and,
+    with tracing on, a client span per command.
+    """
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        started = time.perf_counter()
+        command = str(args[0]).lower()
+        try:
+            with start_span(
+                command.upper(),
+                kind="client",
+                attributes={"db.system": "redis", "db.operation": command},
+            ):
+                return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_DURATION.labels(command=command).observe(
+                time.perf_counter() - started,
+            )
+
+    def pipeline(
+        self,
+        transaction: bool = True,
+        shard_hint: str | None = None,
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class DtoJSONResponse(JSONResponse):
+    """
+    Serializes DTO dataclasses straight to JSON bytes.
+
+    Returning a response skips FastAPI's `response_model` validation, so
+    only use it for DTOs built by our own code. Keep the `response_model`
+    on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
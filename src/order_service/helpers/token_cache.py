@@ -0,0 +1,81 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from order_service.helpers.metrics import TOKEN_CACHE_LOOKUPS
+
+_Entry = tuple[float, dict[str, Any]]
+
+
+class TokenCache:
+    """
+    Process-local LRU of decoded JWT payloads.
+
+    Keys are digests of the whole token (signature included), so only a
+    token that already passed `jwt.decode` can hit. An entry lives for at
+    most `ttl_seconds` and never past the token's own `exp`.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._hit_counter = TOKEN_CACHE_LOOKUPS.labels(result="hit")
+        self._miss_counter = TOKEN_CACHE_LOOKUPS.labels(result="miss")
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record(hit=False)
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._record(hit=False)
+            return None
+
+        self._entries.move_to_end(key)
+        self._record(hit=True)
+        return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        if self._max_size <= 0:
+            return
+
+        expires_at = time.time() + self._ttl_seconds
+        if "exp" in payload:
+            expires_at = min(expires_at, float(payload["exp"]))
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+            self._hit_counter.inc()
+        else:
+            self._misses += 1
+            self._miss_counter.inc()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
@@ -0,0 +1,225 @@
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from typing import Any
+
+from order_service.settings import TracingExporter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# W3C trace context and baggage, the default OpenTelemetry propagators
+TRACE_HEADERS = ("traceparent", "tracestate", "baggage")
+
+# OpenTelemetry is an optional extra (`uv sync --extra tracing`), so it is
+# only imported by `configure_tracing`; until then every helper is a no-op
+_tracer: Any = None
+_trace: Any = None
+_propagate: Any = None
+_context: Any = None
+
+
+def build_span_exporter(
+    exporter: TracingExporter,
+    otlp_endpoint: str,
+) -> Any:
+    """
+    :param exporter: `otlp` for a collector, `memory` to inspect spans in tests
+    :param otlp_endpoint: Collector base URL, e.g. `http://localhost:4318`
+    :return: Span exporter
+    """
+    if exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        return InMemorySpanExporter()
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    return OTLPSpanExporter(endpoint=f"{otlp_endpoint.rstrip('/')}/v1/traces")
+
+
+def configure_tracing(
+    service_name: str,
+    exporter: Any,
+    sample_ratio: float = 1.0,
+) -> Any:
+    """
+    Installs the tracer provider of this process.
+
+    Sampling follows the parent span, so a trace started by the API is kept
+    or dropped as a whole by the consumer and the worker.
+    :param service_name: `service.name` of the spans
+    :param exporter: See `build_span_exporter`
+    :param sample_ratio: Share of new traces to record
+    :return: Tracer provider, also set as the global one
+    """
+    global _tracer, _trace, _propagate, _context
+
+    from opentelemetry import context
+    from opentelemetry import propagate
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased
+    from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    # Tests read in-memory spans right after the request, so skip batching
+    if isinstance(exporter, InMemorySpanExporter):
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    _trace, _propagate, _context = trace, propagate, context
+    _tracer = provider.get_tracer("order_service")
+    return provider
+
+
+def start_span(
+    name: str,
+    kind: str = "internal",
+    attributes: dict[str, Any] | None = None,
+) -> AbstractContextManager:
+    """
+    Starts a child of the current span.
+
+    Outside of a recorded span (or with tracing off) nothing is started, so
+    background polling such as the outbox relay does not flood the
+    collector with single-span traces.
+    :param kind: `SpanKind` member name, e.g. `client`
+    """
+    if _tracer is None or not _trace.get_current_span().is_recording():
+        return nullcontext()
+
+    return _tracer.start_as_current_span(
+        name,
+        kind=_trace.SpanKind[kind.upper()],
+        attributes=attributes,
+    )
+
+
+def inject_context() -> dict[str, str]:
+    """
+    :return: Propagation headers of the current span, empty without one
+    """
+    carrier: dict[str, str] = {}
+    if _tracer is not None:
+        _propagate.inject(carrier)
+    return carrier
+
+
+def trace_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """
+    :param headers: Message headers, e.g. of a consumed Kafka record
+    :return: The subset of `headers` that carries trace context
+    """
+    return {name: headers[name] for name in TRACE_HEADERS if name in headers}
+
+
+@contextmanager
+def use_context(carrier: Mapping[str, str] | None) -> Iterator[None]:
+    """Makes the span propagated in `carrier` the current one."""
+    if not carrier or _tracer is None:
+        yield
+        return
+
+    token = _context.attach(_propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        _context.detach(token)
+
+
+def trace_queries(engine: AsyncEngine) -> None:
+    """Records a client span of every statement run by `engine`"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args: Any) -> None:
+        if _tracer is None or not _trace.get_current_span().is_recording():
+            return
+
+        conn.info["query_span"] = _tracer.start_span(
+            statement.split(maxsplit=1)[0].upper(),
+            kind=_trace.SpanKind.CLIENT,
+            attributes={
+                "db.system": engine.dialect.name,
+                "db.statement": statement,
+            },
+        )
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, *args: Any) -> None:
+        span = conn.info.pop("query_span", None)
+        if span is not None:
+            span.end()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context: Any) -> None:
+        conn = exception_context.connection
+        span = conn.info.pop("query_span", None) if conn is not None else None
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(_trace.Status(_trace.StatusCode.ERROR))
+            span.end()
+
+
+class TracingMiddleware:
+    """
+    Starts a server span for every HTTP request.
+
+    Continues the trace of an incoming `traceparent` header; the span is
+    named after the route template once the router matched one.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self._app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or _tracer is None:
+            await self._app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+        method = scope["method"]
+        with _tracer.start_as_current_span(
+            method,
+            context=_propagate.extract(headers, _context.get_current()),
+            kind=_trace.SpanKind.SERVER,
+            attributes={
+                "http.request.method": method,
+                "url.path": scope["path"],
+            },
+        ) as span:
+
+            async def send_with_status(message: dict) -> None:
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        span.set_status(_trace.Status(_trace.StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self._app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.update_name(f"{method} {route}")
+                    span.set_attribute("http.route", route)
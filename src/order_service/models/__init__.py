@@ -1,5 +1,6 @@
 from .base import BaseModel
 from .order import Order
+from .outbox import OutboxEvent
 from .user import User
 
-__all__ = ["BaseModel", "User", "Order"]
+__all__ = ["BaseModel", "User", "Order", "OutboxEvent"]
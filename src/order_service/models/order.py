@@ -8,14 +8,24 @@ from sqlalchemy import DateTime
 from sqlalchemy import Enum
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import JSON
 from sqlalchemy import String
+from sqlalchemy import text
 from sqlalchemy.orm import Mapped
 from sqlalchemy.testing.schema import mapped_column
 
 
 class Order(BaseModel):
     __tablename__ = "order"
+    __table_args__ = (
+        Index(
+            "ix_order_user_id_created_at_id",
+            "user_id",
+            text("created_at DESC"),
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(), primary_key=True, default=lambda: str(ulid.ULID())
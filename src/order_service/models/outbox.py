@@ -0,0 +1,33 @@
+from datetime import datetime
+
+import ulid
+from order_service.dto.outbox import OutboxEventDTO
+from order_service.models.base import BaseModel
+from sqlalchemy import DateTime
+from sqlalchemy import JSON
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class OutboxEvent(BaseModel):
+    __tablename__ = "outbox"
+
+    id: Mapped[str] = mapped_column(
+        String(), primary_key=True, default=lambda: str(ulid.ULID())
+    )
+    topic: Mapped[str] = mapped_column(String(), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Propagation headers of the span that queued the event, if traced
+    trace_context: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now, index=True
+    )
+
+    def to_dto(self) -> OutboxEventDTO:
+        return OutboxEventDTO(
+            id=self.id,
+            topic=self.topic,
+            payload=self.payload,
+            trace_context=self.trace_context,
+        )
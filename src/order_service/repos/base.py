@@ -1,19 +1,53 @@
+import logging
+from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Sequence
 from math import ceil
 from typing import Any
 
+from order_service.dto.base import CursorPageDTO
 from order_service.dto.base import PageDTO
 from order_service.dto.base import T
+from order_service.helpers.pagination import decode_cursor
+from order_service.helpers.pagination import encode_cursor
 from sqlalchemy import func
+from sqlalchemy import or_
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm import noload
 
 
+# `session.info` key of the callbacks deferred with `_after_commit`
+AFTER_COMMIT_KEY = "after_commit"
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """
+    Runs the callbacks repositories deferred until `session` committed.
+
+    The data is already committed by then, so a failing callback is only
+    logged; the others still run.
+    :param session: A session that was just committed
+    """
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        try:
+            await callback()
+        except Exception as error:
+            logging.error(msg="After commit callback failed", exc_info=error)
+
+
 class BaseRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def _after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Defers `callback` until the transaction is committed, e.g. cache
+        writes that must not expose uncommitted rows to other requests
+        """
+        self._session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
     async def _fetch(
         self,
         query: Select,
@@ -29,11 +63,7 @@ class BaseRepository:
         :param mapper_fn: A mapper fn, converts raw object to DTO
         :return:
         """
-        total = await self._session.scalar(
-            query.order_by(None)
-            .options(noload("*"))
-            .with_only_columns(func.count(), maintain_column_froms=True)
-        )
+        total = await self._count(query)
         q = query.offset((page - 1) * page_size).limit(page_size)
         rows = (await self._session.execute(q)).unique().scalars().fetchall()
         items = [mapper_fn(item) for item in rows]
@@ -46,3 +76,66 @@ class BaseRepository:
             page_size=page_size,
             total_items=total,
         )
+
+    async def _fetch_by_cursor(
+        self,
+        query: Select,
+        cursor: str | None,
+        page_size: int,
+        created_at_column: InstrumentedAttribute,
+        id_column: InstrumentedAttribute,
+        mapper_fn: Callable[[Any], T],
+        with_total: bool = False,
+    ) -> CursorPageDTO[T]:
+        """
+        Fetches rows after `cursor` in `(created_at DESC, id)` order
+        :param query: A query (`Select` instance)
+        :param cursor: An opaque cursor from the previous page, if any
+        :param page_size: A needed page-size
+        :param created_at_column: A timestamp column of the keyset
+        :param id_column: A unique tie-breaker column of the keyset
+        :param mapper_fn: A mapper fn, converts raw object to DTO
+        :param with_total: Whether to run an extra `COUNT` query
+        :return:
+        """
+        total = await self._count(query) if with_total else None
+
+        q = query.order_by(created_at_column.desc(), id_column)
+        if cursor is not None:
+            created_at, row_id = decode_cursor(cursor)
+            # The `<=` bound is what the index can seek on; the `OR` alone
+            # only filters, which scans every row before the cursor
+            q = q.where(
+                created_at_column <= created_at,
+                or_(created_at_column < created_at, id_column > row_id),
+            )
+
+        # One extra row tells whether a next page exists without counting
+        q = q.limit(page_size + 1)
+        rows: Sequence[Any] = (
+            (await self._session.execute(q)).unique().scalars().fetchall()
+        )
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            next_cursor = encode_cursor(
+                getattr(last_row, created_at_column.key),
+                getattr(last_row, id_column.key),
+            )
+
+        return CursorPageDTO(
+            items=[mapper_fn(item) for item in rows],
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total_items=total,
+        )
+
+    async def _count(self, query: Select) -> int:
+        total = await self._session.scalar(
+            query.order_by(None)
+            .options(noload("*"))
+            .with_only_columns(func.count(), maintain_column_froms=True)
+        )
+        return total or 0
@@ -1,18 +1,119 @@
+import asyncio
 import json
 import logging
+import math
+import random
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Collection
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import ulid
+from order_service.dto.base import CursorPageDTO
 from order_service.dto.base import PageDTO
+from order_service.dto.order import CachedOrderDTO
+from order_service.dto.order import OrderCreateItemDTO
 from order_service.dto.order import OrderDTO
 from order_service.enums.order import OrderStatus
+from order_service.helpers.metrics import ORDER_CACHE_LOOKUPS
+from order_service.helpers.order_cache import CacheTierStats
+from order_service.helpers.order_cache import encode_invalidation
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.helpers.order_cache import ORDER_INVALIDATION_CHANNEL
+from order_service.helpers.order_codec import decode_order_page
+from order_service.helpers.order_codec import DEFAULT_ORDER_CODEC
+from order_service.helpers.order_codec import encode_order_page
+from order_service.helpers.order_codec import MISSING_ORDER_MARKER
+from order_service.helpers.order_codec import ORDER_CACHE_CODECS
+from order_service.helpers.order_codec import OrderCacheCodec
+from order_service.helpers.order_codec import P
+from order_service.helpers.pagination import decode_cursor
+from order_service.helpers.single_flight import SingleFlight
 from order_service.models import Order
 from order_service.repos.base import BaseRepository
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.commands.core import AsyncScript
+from sqlalchemy import any_
+from sqlalchemy import ARRAY
+from sqlalchemy import bindparam
+from sqlalchemy import insert
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Both cache layouts are understood while the writers are switched over:
+# the legacy per-field hash and a codec encoded string
+GET_CACHED_ORDER_LUA = """
+local kind = redis.call("TYPE", KEYS[1])["ok"]
+if kind == "string" then
+    return {kind, redis.call("GET", KEYS[1]), redis.call("PTTL", KEYS[1])}
+elseif kind == "hash" then
+    return {kind, redis.call("HGETALL", KEYS[1]), redis.call("PTTL", KEYS[1])}
+end
+return false
+"""
+SET_CACHED_STATUS_LUA = """
+local kind = redis.call("TYPE", KEYS[1])["ok"]
+if kind == "hash" then
+    redis.call("HSET", KEYS[1], "status", ARGV[1])
+elseif kind == "string" then
+    redis.call("SET", KEYS[1], ARGV[2], "KEEPTTL")
+else
+    return 0
+end
+return 1
+"""
+# Negative entry of the hash layout, see `_queue_cache_set_missing`
+CACHE_MISSING_HASH_LUA = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+redis.call("HSET", KEYS[1], "missing", "1")
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+return 1
+"""
+RELEASE_LOCK_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+GET_CACHED_PAGE_LUA = """
+local version = redis.call("GET", KEYS[1]) or "0"
+return {version, redis.call("GET", ARGV[1] .. version .. ARGV[2])}
+"""
+# Polling step of requests waiting for another process to fill the cache
+LOCK_WAIT_STEP_SECONDS = 0.02
+# Must outlive any cached listing page, see `_queue_listing_bump`
+LISTING_VERSION_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class OrderCacheScripts:
+    """Lua scripts of `OrderRepository`, registered once per process"""
+
+    get_cached_page: AsyncScript
+    get_cached_order: AsyncScript
+    set_cached_status: AsyncScript
+    cache_missing_hash: AsyncScript
+    release_lock: AsyncScript
+
+    @classmethod
+    def register(cls, redis: Redis) -> "OrderCacheScripts":
+        return cls(
+            get_cached_page=redis.register_script(GET_CACHED_PAGE_LUA),
+            get_cached_order=redis.register_script(GET_CACHED_ORDER_LUA),
+            set_cached_status=redis.register_script(SET_CACHED_STATUS_LUA),
+            cache_missing_hash=redis.register_script(CACHE_MISSING_HASH_LUA),
+            release_lock=redis.register_script(RELEASE_LOCK_LUA),
+        )
+
 
 class OrderRepository(BaseRepository):
     def __init__(
@@ -20,32 +121,114 @@ class OrderRepository(BaseRepository):
         session: AsyncSession,
         redis: Redis,
         order_cache_ttl_seconds: int = 300,
+        local_cache: LocalOrderCache | None = None,
+        redis_cache_stats: CacheTierStats | None = None,
+        single_flight: SingleFlight | None = None,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
+        negative_cache_ttl_seconds: int = 0,
+        load_lock_ttl_ms: int = 2000,
+        early_refresh_beta: float = 0.0,
+        cache_codec: OrderCacheCodec | None = None,
+        listing_cache_ttl_seconds: int = 0,
+        scripts: OrderCacheScripts | None = None,
     ) -> None:
         self._redis = redis
         self._order_cache_ttl_seconds = order_cache_ttl_seconds
+        self._local_cache = local_cache
+        self._redis_cache_stats = redis_cache_stats
+        self._single_flight = single_flight
+        self._session_maker = session_maker
+        self._negative_cache_ttl_seconds = negative_cache_ttl_seconds
+        self._load_lock_ttl_ms = load_lock_ttl_ms
+        self._early_refresh_beta = early_refresh_beta
+        # `None` keeps writing the legacy hash layout
+        self._cache_codec = cache_codec
+        self._listing_cache_ttl_seconds = listing_cache_ttl_seconds
+        self._scripts = scripts or OrderCacheScripts.register(redis)
         super().__init__(session)
 
     async def get_order_by_id(self, order_id: str) -> OrderDTO | None:
+        if self._local_cache is not None:
+            local = self._local_cache.get(order_id)
+            if local is not None:
+                return local
+
         cached = await self._cache_get(order_id)
-        if cached:
+        if self._redis_cache_stats is not None:
+            self._redis_cache_stats.record(hit=cached is not None)
+        if cached is not None and not self._should_refresh_early(cached):
+            if cached.order is not None and self._local_cache is not None:
+                self._local_cache.set(cached.order)
             logging.debug(
                 "Order %s loaded from cache",
                 order_id,
             )
-            return cached
+            return cached.order
 
-        logging.debug(
-            "Order %s loaded from db",
-            order_id,
-        )
+        if self._single_flight is None or self._session_maker is None:
+            return await self._load_order_once(order_id, cached)
 
-        obj = await self._db_get(order_id)
-        if not obj:
-            return None
+        session_maker = self._session_maker
 
-        dto = obj.to_dto()
-        await self._cache_set(dto)
-        return dto
+        async def load_shared() -> OrderDTO | None:
+            # Not on the session of the request that happened to start it:
+            # that one may finish, or be cancelled, before the others
+            async with session_maker() as session:
+                return await self._load_order_once(order_id, cached, session)
+
+        # Concurrent misses in this process share one load
+        return await self._single_flight.do(order_id, load_shared)
+
+    async def get_orders_by_ids(
+        self,
+        order_ids: list[str],
+    ) -> dict[str, OrderDTO]:
+        """
+        Looks up many orders with one Redis pipeline and a single db query
+        for the misses, which are then cached in one pipeline
+        :param order_ids: Unique ids to look up
+        :return: Found orders by id, unknown ids are left out
+        """
+        found: dict[str, OrderDTO] = {}
+        lookup_ids = []
+        for order_id in order_ids:
+            local = None
+            if self._local_cache is not None:
+                local = self._local_cache.get(order_id)
+            if local is not None:
+                found[order_id] = local
+            else:
+                lookup_ids.append(order_id)
+
+        if not lookup_ids:
+            return found
+
+        missed_ids = []
+        cached_orders = await self._cache_get_many(lookup_ids)
+        for order_id, cached in zip(lookup_ids, cached_orders):
+            if self._redis_cache_stats is not None:
+                self._redis_cache_stats.record(hit=cached is not None)
+            if cached is None:
+                missed_ids.append(order_id)
+            elif cached.order is not None:
+                found[order_id] = cached.order
+                if self._local_cache is not None:
+                    self._local_cache.set(cached.order)
+
+        if not missed_ids:
+            return found
+
+        # One statement text for any number of ids
+        stmt = select(Order).where(
+            Order.id == any_(bindparam("order_ids", type_=ARRAY(String())))
+        )
+        result = await self._session.execute(stmt, {"order_ids": missed_ids})
+        loaded = [obj.to_dto() for obj in result.scalars().all()]
+        found.update((order.id, order) for order in loaded)
+
+        unknown_ids = [oid for oid in missed_ids if oid not in found]
+        await self._cache_fill(loaded, unknown_ids)
+        return found
 
     async def create_order(
         self,
@@ -53,75 +236,480 @@ class OrderRepository(BaseRepository):
         items: dict[str, Any],
         order_price: float,
     ) -> OrderDTO:
+        # Every column is known up front, so one INSERT and no refresh
         order_obj = Order(
+            id=str(ulid.ULID()),
             user_id=user_id,
             items=items,
+            status=OrderStatus.PENDING,
+            created_at=datetime.now(),
             order_price=order_price,
         )
 
         self._session.add(order_obj)
         await self._session.flush()
-        await self._session.refresh(order_obj)
 
         dto = order_obj.to_dto()
-        await self._cache_set(dto)
+        self._after_commit(lambda: self._cache_set(dto))
         return dto
 
-    async def update_order_status(
-        self, order: OrderDTO, new_status: OrderStatus
-    ) -> OrderDTO:
-        stmt = (
-            update(Order)
-            .where(Order.id == order.id)
-            .values(status=new_status)
-            .returning(Order)
-        )
+    async def create_orders(
+        self,
+        user_id: str,
+        orders: list[OrderCreateItemDTO],
+    ) -> list[OrderDTO]:
+        created_at = datetime.now()
+        rows: list[dict[str, Any]] = [
+            {
+                "id": str(ulid.ULID()),
+                "user_id": user_id,
+                "items": order.items,
+                "status": OrderStatus.PENDING,
+                "created_at": created_at,
+                "order_price": order.order_price,
+            }
+            for order in orders
+        ]
 
+        # A single multi-row `INSERT ... RETURNING`
+        stmt = insert(Order).values(rows).returning(Order)
         result = await self._session.execute(stmt)
-        await self._session.flush()
+        created = {obj.id: obj.to_dto() for obj in result.scalars().all()}
 
-        updated_obj = result.scalar_one()
-        dto = updated_obj.to_dto()
+        dtos = [created[row["id"]] for row in rows]
+        self._after_commit(lambda: self._cache_set_many(dtos))
+        return dtos
+
+    async def update_order_status(
+        self,
+        order_id: str,
+        new_status: OrderStatus,
+        user_id: str | None = None,
+        expected_statuses: Collection[OrderStatus] | None = None,
+    ) -> OrderDTO | None:
+        """
+        Updates status with a single `UPDATE ... RETURNING`
+        :param order_id: An order to update
+        :param new_status: A status to set
+        :param user_id: Only update if the order belongs to this user
+        :param expected_statuses: Only update if the order is in one of these
+        :return: An updated order or `None` if no row matched
+        """
+        stmt = update(Order).where(Order.id == order_id)
+        if user_id is not None:
+            stmt = stmt.where(Order.user_id == user_id)
+        if expected_statuses is not None:
+            stmt = stmt.where(Order.status.in_(expected_statuses))
 
-        await self._cache_set(dto)
+        result = await self._session.execute(
+            stmt.values(status=new_status).returning(Order)
+        )
+        updated_obj = result.scalar_one_or_none()
+        if updated_obj is None:
+            return None
+
+        dto = updated_obj.to_dto()
+        self._after_commit(lambda: self._cache_set_status(dto))
         return dto
 
+    async def get_order_state(
+        self,
+        order_id: str,
+    ) -> tuple[str, OrderStatus] | None:
+        """
+        Reads owner and status straight from the db, bypassing the cache
+        :return: `(user_id, status)` or `None` if there is no such order
+        """
+        stmt = select(Order.user_id, Order.status).where(Order.id == order_id)
+        row = (await self._session.execute(stmt)).first()
+        if row is None:
+            return None
+
+        return row.user_id, row.status
+
     async def fetch_orders(
         self, page_size: int, page: int, user_id: str
     ) -> PageDTO[OrderDTO]:
+        stmt = (
+            select(Order)
+            .where(Order.user_id == user_id)
+            .order_by(Order.created_at.desc(), Order.id)
+        )
+        return await self._cached_listing(
+            user_id,
+            variant=f"offset:{page_size}:{page}",
+            page_type=PageDTO,
+            load=lambda: self._fetch(
+                query=stmt,
+                page_size=page_size,
+                page=page,
+                mapper_fn=lambda x: x.to_dto(),
+            ),
+        )
+
+    async def fetch_orders_by_cursor(
+        self,
+        page_size: int,
+        cursor: str | None,
+        user_id: str,
+        with_total: bool = False,
+    ) -> CursorPageDTO[OrderDTO]:
+        if cursor is not None:
+            # Rejects a malformed cursor before it becomes part of a cache key
+            decode_cursor(cursor)
+
         stmt = select(Order).where(Order.user_id == user_id)
-        return await self._fetch(
-            query=stmt,
-            page_size=page_size,
-            page=page,
-            mapper_fn=lambda x: x.to_dto(),
+        return await self._cached_listing(
+            user_id,
+            variant=f"cursor:{page_size}:{int(with_total)}:{cursor or ''}",
+            page_type=CursorPageDTO,
+            load=lambda: self._fetch_by_cursor(
+                query=stmt,
+                cursor=cursor,
+                page_size=page_size,
+                created_at_column=Order.created_at,
+                id_column=Order.id,
+                mapper_fn=lambda x: x.to_dto(),
+                with_total=with_total,
+            ),
         )
 
-    async def _db_get(self, order_id: str) -> Order | None:
+    async def _cached_listing(
+        self,
+        user_id: str,
+        variant: str,
+        page_type: type[P],
+        load: Callable[[], Awaitable[P]],
+    ) -> P:
+        """
+        Serves a listing page from Redis under the user's current listing
+        version. Writes replace the version instead of deleting pages, so
+        stale pages are never read again and simply expire
+        :param user_id: Whose orders are listed
+        :param variant: Page parameters, part of the cache key
+        :param page_type: `PageDTO` or `CursorPageDTO`
+        :param load: Loads the page from db on a miss
+        :return: A listing page
+        """
+        if self._listing_cache_ttl_seconds <= 0:
+            return await load()
+
+        prefix = f"order-listing:{user_id}:"
+        version, cached = await self._scripts.get_cached_page(
+            keys=[self._listing_version_key(user_id)],
+            args=[prefix, f":{variant}"],
+        )
+        page = None if cached is None else decode_order_page(cached, page_type)
+        ORDER_CACHE_LOOKUPS.labels(
+            tier="listing",
+            result="miss" if page is None else "hit",
+        ).inc()
+        if page is not None:
+            return page
+
+        page = await load()
+        # Stored under the version read before loading: if a write bumped
+        # it meanwhile, this page is never served
+        await self._redis.set(
+            f"{prefix}{version}:{variant}",
+            encode_order_page(page),
+            ex=self._listing_cache_ttl_seconds,
+        )
+        return page
+
+    async def _load_order_once(
+        self,
+        order_id: str,
+        stale: CachedOrderDTO | None,
+        session: AsyncSession | None = None,
+    ) -> OrderDTO | None:
+        """
+        Loads an order from db while holding a short Redis lock, so only
+        one process reloads a key at a time
+        :param order_id: An order to load
+        :param stale: A still valid entry picked for early refresh
+        :param session: Session to load with, the repository's by default
+        :return: An order or `None` if there is no such order
+        """
+        lock_key = self._load_lock_key(order_id)
+        token = str(ulid.ULID())
+        acquired = await self._redis.set(
+            lock_key,
+            token,
+            nx=True,
+            px=self._load_lock_ttl_ms,
+        )
+        if not acquired:
+            # Someone else is refreshing, keep serving what we have
+            if stale is not None:
+                return stale.order
+
+            cached = await self._wait_for_cache(order_id)
+            if cached is not None:
+                return cached.order
+
+            # The holder gave up or timed out without filling the cache
+            return await self._load_from_db(order_id, session)
+
+        try:
+            return await self._load_from_db(order_id, session)
+        finally:
+            await self._scripts.release_lock(keys=[lock_key], args=[token])
+
+    async def _wait_for_cache(self, order_id: str) -> CachedOrderDTO | None:
+        lock_key = self._load_lock_key(order_id)
+        deadline = time.monotonic() + self._load_lock_ttl_ms / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_WAIT_STEP_SECONDS)
+            cached = await self._cache_get(order_id)
+            if cached is not None:
+                return cached
+            if not await self._redis.exists(lock_key):
+                break
+
+        return None
+
+    async def _load_from_db(
+        self,
+        order_id: str,
+        session: AsyncSession | None = None,
+    ) -> OrderDTO | None:
+        logging.debug(
+            "Order %s loaded from db",
+            order_id,
+        )
+
+        started = time.perf_counter()
+        obj = await self._db_get(order_id, session)
+        load_ms = (time.perf_counter() - started) * 1000
+        if not obj:
+            await self._cache_fill([], [order_id])
+            return None
+
+        dto = obj.to_dto()
+        await self._cache_fill([dto], [], load_ms=load_ms)
+        return dto
+
+    def _should_refresh_early(self, cached: CachedOrderDTO) -> bool:
+        """
+        Probabilistic early expiration (XFetch): the closer the entry is to
+        its expiry and the slower it was to load, the likelier one request
+        reloads it before it expires for everybody
+        """
+        if self._early_refresh_beta <= 0 or cached.load_ms is None:
+            return False
+
+        gap = -cached.load_ms * self._early_refresh_beta
+        gap *= math.log(1.0 - random.random())
+        return gap >= cached.ttl_ms
+
+    async def _db_get(
+        self,
+        order_id: str,
+        session: AsyncSession | None = None,
+    ) -> Order | None:
         stmt = select(Order).where(Order.id == order_id)
-        result = await self._session.execute(stmt)
+        result = await (session or self._session).execute(stmt)
         return result.scalars().first()
 
-    async def _cache_get(self, order_id: str) -> OrderDTO | None:
+    async def _cache_get(self, order_id: str) -> CachedOrderDTO | None:
         key = self._order_key(order_id)
-        payload = await self._redis.hgetall(key)
-        if not payload:
-            return None
+        result = await self._scripts.get_cached_order(keys=[key])
+        return self._parse_cached(result)
 
-        return self._load_order(payload)
+    async def _cache_get_many(
+        self,
+        order_ids: list[str],
+    ) -> list[CachedOrderDTO | None]:
+        pipe = self._redis.pipeline(transaction=False)
+        for order_id in order_ids:
+            await self._scripts.get_cached_order(
+                keys=[self._order_key(order_id)],
+                client=pipe,
+            )
+        results = await pipe.execute()
+        return [self._parse_cached(result) for result in results]
+
+    async def _cache_fill(
+        self,
+        orders: list[OrderDTO],
+        missing_ids: list[str],
+        load_ms: float | None = None,
+    ) -> None:
+        # Caches what was just read from db; nothing changed, so other
+        # processes are not asked to drop their local copies
+        pipe = self._redis.pipeline(transaction=False)
+        for order in orders:
+            self._queue_cache_set(pipe, order, load_ms)
+            if self._local_cache is not None:
+                self._local_cache.set(order)
+        for order_id in missing_ids:
+            await self._queue_cache_set_missing(pipe, order_id)
+        await pipe.execute()
+
+    async def _cache_set_status(self, order: OrderDTO) -> None:
+        codec = self._cache_codec or DEFAULT_ORDER_CODEC
+        pipe = self._redis.pipeline(transaction=False)
+        # Cached orders are updated in place, in their own layout
+        await self._scripts.set_cached_status(
+            keys=[self._order_key(order.id)],
+            args=[str(order.status), codec.encode(order)],
+            client=pipe,
+        )
+        self._publish_invalidation(pipe, [order])
+        self._queue_listing_bump(pipe, [order])
+        updated, *_ = await pipe.execute()
+        if updated:
+            return
+
+        # Not cached (or evicted meanwhile), so write the whole entry
+        pipe = self._redis.pipeline(transaction=False)
+        self._queue_cache_set(pipe, order)
+        await pipe.execute()
 
     async def _cache_set(self, order: OrderDTO) -> None:
+        await self._cache_set_many([order])
+
+    async def _cache_set_many(self, orders: list[OrderDTO]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for order in orders:
+            self._queue_cache_set(pipe, order)
+        self._publish_invalidation(pipe, orders)
+        self._queue_listing_bump(pipe, orders)
+        await pipe.execute()
+
+    def _queue_cache_set(
+        self,
+        pipe: Pipeline,
+        order: OrderDTO,
+        load_ms: float | None = None,
+    ) -> None:
         key = self._order_key(order.id)
+        if self._cache_codec is not None:
+            pipe.set(
+                key,
+                self._cache_codec.encode(order, load_ms),
+                ex=self._order_cache_ttl_seconds,
+            )
+            return
+
         data = self._dump_order(order)
-        pipe = self._redis.pipeline(transaction=False)
+        if load_ms is not None:
+            data["load_ms"] = f"{load_ms:.3f}"
+        # The key may hold a string written before a switch back
+        pipe.delete(key)
         pipe.hset(key, mapping=data)  # type: ignore
         pipe.expire(key, time=self._order_cache_ttl_seconds)
-        await pipe.execute()
+
+    async def _queue_cache_set_missing(
+        self,
+        pipe: Pipeline,
+        order_id: str,
+    ) -> None:
+        if self._negative_cache_ttl_seconds <= 0:
+            return
+
+        # Never over an existing entry: the read may have raced a create
+        # whose after-commit write already cached the order
+        key = self._order_key(order_id)
+        if self._cache_codec is not None:
+            pipe.set(
+                key,
+                MISSING_ORDER_MARKER,
+                ex=self._negative_cache_ttl_seconds,
+                nx=True,
+            )
+            return
+
+        await self._scripts.cache_missing_hash(
+            keys=[key],
+            args=[self._negative_cache_ttl_seconds],
+            client=pipe,
+        )
+
+    def _publish_invalidation(
+        self,
+        pipe: Pipeline,
+        orders: list[OrderDTO],
+    ) -> None:
+        # Other processes drop their local copies, this one refreshes its own
+        origin = ""
+        if self._local_cache is not None:
+            origin = self._local_cache.origin
+            for order in orders:
+                self._local_cache.set(order)
+
+        pipe.publish(
+            ORDER_INVALIDATION_CHANNEL,
+            encode_invalidation(origin, (order.id for order in orders)),
+        )
+
+    def _queue_listing_bump(
+        self,
+        pipe: Pipeline,
+        orders: list[OrderDTO],
+    ) -> None:
+        # Queued after commit only: bumped earlier, a concurrent read could
+        # still cache a page without the change under the new version.
+        # A fresh unique stamp rather than INCR: once the key expires and
+        # starts over, old pages can never match the new version. Bumped
+        # even with the listing cache off here, other processes may use it
+        for user_id in {order.creator_id for order in orders}:
+            pipe.set(
+                self._listing_version_key(user_id),
+                str(ulid.ULID()),
+                ex=LISTING_VERSION_TTL_SECONDS,
+            )
+
+    @staticmethod
+    def _listing_version_key(user_id: str) -> str:
+        return f"order-listing-version:{user_id}"
 
     @staticmethod
     def _order_key(order_id: str) -> str:
         return f"order:{order_id}"
 
+    @staticmethod
+    def _load_lock_key(order_id: str) -> str:
+        return f"order-load-lock:{order_id}"
+
+    @classmethod
+    def _parse_cached(cls, result: list | None) -> CachedOrderDTO | None:
+        if not result:
+            return None
+
+        kind, payload, ttl_ms = result
+        if kind == "hash":
+            return cls._load_hash_entry(
+                dict(zip(payload[::2], payload[1::2])),
+                ttl_ms,
+            )
+
+        if payload == MISSING_ORDER_MARKER:
+            return CachedOrderDTO(order=None, ttl_ms=ttl_ms)
+
+        codec = ORDER_CACHE_CODECS.get(payload[:1])
+        if codec is None:
+            # Written by a newer release, treat as a miss
+            return None
+
+        order, load_ms = codec.decode(payload)
+        return CachedOrderDTO(order=order, ttl_ms=ttl_ms, load_ms=load_ms)
+
+    @classmethod
+    def _load_hash_entry(
+        cls,
+        payload: dict[str, str],
+        ttl_ms: int,
+    ) -> CachedOrderDTO:
+        load_ms = payload.get("load_ms")
+        return CachedOrderDTO(
+            # A hash without `id` is a cached "no such order"
+            order=cls._load_order(payload) if "id" in payload else None,
+            ttl_ms=ttl_ms,
+            load_ms=float(load_ms) if load_ms is not None else None,
+        )
+
     @staticmethod
     def _dump_order(order: OrderDTO) -> dict[str, str]:
         return {
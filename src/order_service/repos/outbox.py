@@ -0,0 +1,60 @@
+from typing import Any
+
+from order_service.dto.outbox import OutboxEventDTO
+from order_service.helpers.tracing import inject_context
+from order_service.models import OutboxEvent
+from order_service.repos.base import BaseRepository
+from sqlalchemy import delete
+from sqlalchemy import select
+
+
+class OutboxRepository(BaseRepository):
+    """
+    Events remember the trace context they were added in, so the relay can
+    publish them as part of the originating request's trace.
+    """
+
+    async def add_event(self, topic: str, payload: dict[str, Any]) -> None:
+        self._session.add(
+            OutboxEvent(
+                topic=topic,
+                payload=payload,
+                trace_context=inject_context() or None,
+            )
+        )
+
+    async def add_events(
+        self,
+        topic: str,
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        trace_context = inject_context() or None
+        self._session.add_all(
+            [
+                OutboxEvent(
+                    topic=topic,
+                    payload=payload,
+                    trace_context=trace_context,
+                )
+                for payload in payloads
+            ]
+        )
+
+    async def lock_pending_events(self, limit: int) -> list[OutboxEventDTO]:
+        """
+        Locks the oldest unpublished events for the current transaction.
+        Rows locked by concurrent relays are skipped.
+        """
+        stmt = (
+            select(OutboxEvent)
+            .order_by(OutboxEvent.created_at, OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = (await self._session.execute(stmt)).scalars().fetchall()
+
+        return [row.to_dto() for row in rows]
+
+    async def delete_events(self, event_ids: list[str]) -> None:
+        stmt = delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids))
+        await self._session.execute(stmt)
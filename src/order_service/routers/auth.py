@@ -2,6 +2,7 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from order_service.dependencies.auth import get_auth_service
+from order_service.dependencies.rate_limit import limit_auth
 from order_service.dto.auth import LoginRequestDTO
 from order_service.dto.auth import TokenPairDTO
 from order_service.dto.user import UserDTO
@@ -19,6 +20,7 @@ router = APIRouter(
     "/register",
     summary="Register a new user",
     response_model=RegistrationResponseSchema,
+    dependencies=[Depends(limit_auth)],
 )
 async def register_user(
     data: RegistrationRequestSchema,
@@ -33,6 +35,7 @@ async def register_user(
     "/auth/token",
     summary="Issue OAuth2 token pair",
     response_model=TokenSchema,
+    dependencies=[Depends(limit_auth)],
 )
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
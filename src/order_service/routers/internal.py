@@ -0,0 +1,45 @@
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Request
+from order_service.dependencies.auth import require_internal_token
+from order_service.dto.internal import DbPoolStatsDTO
+from order_service.dto.internal import OrderCacheStatsDTO
+from order_service.helpers.order_cache import CacheTierStats
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.schemas.internal import DbPoolStatsSchema
+from order_service.schemas.internal import OrderCacheStatsSchema
+
+router = APIRouter(
+    tags=["Internal"],
+    prefix="/internal",
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get(
+    "/db-pool",
+    summary="Database connection pool gauges",
+    response_model=DbPoolStatsSchema,
+)
+async def get_db_pool_stats(request: Request) -> DbPoolStatsDTO:
+    return request.app.state.engine.pool.stats()
+
+
+@router.get(
+    "/order-cache",
+    summary="Order cache hit ratios per tier",
+    response_model=OrderCacheStatsSchema,
+)
+async def get_order_cache_stats(request: Request) -> OrderCacheStatsDTO:
+    local_cache: LocalOrderCache = request.app.state.order_local_cache
+    redis_stats: CacheTierStats = request.app.state.order_redis_cache_stats
+    return OrderCacheStatsDTO(
+        local_size=len(local_cache),
+        local_hits=local_cache.stats.hits,
+        local_misses=local_cache.stats.misses,
+        local_hit_ratio=local_cache.stats.hit_ratio,
+        redis_hits=redis_stats.hits,
+        redis_misses=redis_stats.misses,
+        redis_hit_ratio=redis_stats.hit_ratio,
+    )
@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Request
+from fastapi import Response
+from order_service.dependencies.auth import require_internal_token
+from order_service.helpers.hashing import PasswordHashingPool
+from order_service.helpers.kafka import KafkaEventPublisher
+from order_service.helpers.metrics import CONTENT_TYPE
+from order_service.helpers.metrics import DB_POOL_CONNECTIONS
+from order_service.helpers.metrics import KAFKA_PUBLISH_IN_FLIGHT
+from order_service.helpers.metrics import ORDER_LOCAL_CACHE_SIZE
+from order_service.helpers.metrics import PASSWORD_HASHING_JOBS
+from order_service.helpers.metrics import render_metrics
+from order_service.helpers.metrics import TOKEN_CACHE_SIZE
+from order_service.helpers.order_cache import LocalOrderCache
+from order_service.helpers.token_cache import TokenCache
+
+router = APIRouter(
+    tags=["Internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+def collect_state_metrics(state) -> None:
+    """Copies gauges kept by the app's components into the registry"""
+    pool_stats = state.engine.pool.stats()
+    DB_POOL_CONNECTIONS.labels(state="size").set(pool_stats.size)
+    DB_POOL_CONNECTIONS.labels(state="checked_out").set(
+        pool_stats.checked_out,
+    )
+    DB_POOL_CONNECTIONS.labels(state="overflow").set(pool_stats.overflow)
+
+    hashing_pool: PasswordHashingPool = state.password_hashing_pool
+    PASSWORD_HASHING_JOBS.labels(state="queued").set(hashing_pool.queue_depth)
+    PASSWORD_HASHING_JOBS.labels(state="running").set(hashing_pool.in_flight)
+
+    token_cache: TokenCache = state.token_cache
+    TOKEN_CACHE_SIZE.set(len(token_cache))
+
+    local_cache: LocalOrderCache = state.order_local_cache
+    ORDER_LOCAL_CACHE_SIZE.set(len(local_cache))
+
+    publisher: KafkaEventPublisher = state.event_publisher
+    KAFKA_PUBLISH_IN_FLIGHT.set(publisher.in_flight)
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+)
+async def get_metrics(request: Request) -> Response:
+    collect_state_metrics(request.app.state)
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
@@ -4,14 +4,23 @@ from fastapi import Path
 from fastapi import Query
 from order_service.dependencies.auth import get_current_user
 from order_service.dependencies.order import get_order_service
-from order_service.dto.base import PageDTO
+from order_service.dependencies.rate_limit import limit_by_ip
+from order_service.dependencies.rate_limit import limit_reads
+from order_service.dependencies.rate_limit import limit_writes
 from order_service.dto.order import OrderCreateDTO
 from order_service.dto.order import OrderDTO
+from order_service.dto.order import OrdersBatchFetchRequestDTO
+from order_service.dto.order import OrdersBulkCreateDTO
+from order_service.dto.order import OrdersCursorFetchRequestDTO
 from order_service.dto.order import OrdersFetchRequestDTO
 from order_service.dto.order import UpdateOrderStatusDTO
 from order_service.dto.user import CurrentUserDTO
+from order_service.helpers.responses import DtoJSONResponse
+from order_service.schemas.base import CursorPage
 from order_service.schemas.base import Page
+from order_service.schemas.order import MAX_BATCH_FETCH_ORDERS
 from order_service.schemas.order import OrderCreateRequestSchema
+from order_service.schemas.order import OrdersBulkCreateRequestSchema
 from order_service.schemas.order import OrderSchema
 from order_service.schemas.order import OrderStatusUpdateSchema
 from order_service.services.order import OrderService
@@ -19,7 +28,7 @@ from order_service.services.order import OrderService
 router = APIRouter(
     tags=["Orders"],
     prefix="/orders",
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(limit_by_ip), Depends(get_current_user)],
 )
 
 
@@ -27,13 +36,15 @@ router = APIRouter(
     "/user/{user_id}",
     summary="Get user's orders",
     response_model=Page[OrderSchema],
+    response_class=DtoJSONResponse,
+    dependencies=[Depends(limit_reads)],
 )
 async def get_orders(
     user_id: str = Path(title="User ID"),
     page: int = Query(title="Page", description="Page number", gt=0),
     page_size: int = Query(title="Page Size", description="Page size", gt=0),
     order_service: OrderService = Depends(get_order_service),
-) -> PageDTO[OrderDTO]:
+) -> DtoJSONResponse:
     orders_fetch_request = OrdersFetchRequestDTO(
         page=page,
         page_size=page_size,
@@ -43,13 +54,49 @@ async def get_orders(
         orders_fetch_request,
     )
 
-    return result
+    return DtoJSONResponse(result)
+
+
+@router.get(
+    "/user/{user_id}/cursor",
+    summary="Get user's orders using cursor pagination",
+    response_model=CursorPage[OrderSchema],
+    response_class=DtoJSONResponse,
+    dependencies=[Depends(limit_reads)],
+)
+async def get_orders_by_cursor(
+    user_id: str = Path(title="User ID"),
+    cursor: str | None = Query(
+        default=None,
+        title="Cursor",
+        description="`next_cursor` of the previous page",
+    ),
+    page_size: int = Query(title="Page Size", description="Page size", gt=0),
+    with_total: bool = Query(
+        default=False,
+        title="With Total",
+        description="Also count all user's orders (extra query)",
+    ),
+    order_service: OrderService = Depends(get_order_service),
+) -> DtoJSONResponse:
+    orders_fetch_request = OrdersCursorFetchRequestDTO(
+        cursor=cursor,
+        page_size=page_size,
+        user_id=user_id,
+        with_total=with_total,
+    )
+    result = await order_service.fetch_orders_by_cursor(
+        orders_fetch_request,
+    )
+
+    return DtoJSONResponse(result)
 
 
 @router.post(
     "/",
     response_model=OrderSchema,
     summary="Create a new order",
+    dependencies=[Depends(limit_writes)],
 )
 async def create_order(
     data: OrderCreateRequestSchema,
@@ -69,32 +116,87 @@ async def create_order(
     return created_order
 
 
-@router.get("/{order_id}", summary="Get Order by id")
+@router.post(
+    "/bulk",
+    response_model=list[OrderSchema],
+    summary="Create many orders at once",
+    dependencies=[Depends(limit_writes)],
+)
+async def create_orders(
+    data: OrdersBulkCreateRequestSchema,
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    order_service: OrderService = Depends(get_order_service),
+) -> list[OrderDTO]:
+    dto = OrdersBulkCreateDTO(
+        orders=[order.to_dto() for order in data.orders],
+        current_user=current_user,
+    )
+
+    return await order_service.create_orders(dto)
+
+
+@router.get(
+    "/",
+    response_model=list[OrderSchema],
+    response_class=DtoJSONResponse,
+    summary="Get many orders by id",
+    dependencies=[Depends(limit_reads)],
+)
+async def get_orders_by_ids(
+    ids: list[str] = Query(
+        title="Order IDs",
+        description="Repeat to fetch several orders; unknown ids are skipped",
+        min_length=1,
+        max_length=MAX_BATCH_FETCH_ORDERS,
+    ),
+    current_user: CurrentUserDTO = Depends(get_current_user),
+    order_service: OrderService = Depends(get_order_service),
+) -> DtoJSONResponse:
+    dto = OrdersBatchFetchRequestDTO(
+        order_ids=ids,
+        current_user=current_user,
+    )
+    orders = await order_service.get_orders_by_ids(dto)
+
+    return DtoJSONResponse(orders)
+
+
+@router.get(
+    "/{order_id}",
+    summary="Get Order by id",
+    response_model=OrderSchema,
+    response_class=DtoJSONResponse,
+    dependencies=[Depends(limit_reads)],
+)
 async def get_order(
     order_id: str = Path(title="Order ID"),
     current_user: CurrentUserDTO = Depends(get_current_user),
     order_service: OrderService = Depends(get_order_service),
-) -> OrderDTO:
-    return await order_service.get_order_by_id(
+) -> DtoJSONResponse:
+    order = await order_service.get_order_by_id(
         order_id=order_id,
         current_user=current_user,
     )
 
+    return DtoJSONResponse(order)
+
 
 @router.patch(
     "/{order_id}",
     response_model=OrderSchema,
+    dependencies=[Depends(limit_writes)],
 )
 async def update_order(
     data: OrderStatusUpdateSchema,
-    order: OrderDTO = Depends(get_order),
+    order_id: str = Path(title="Order ID"),
     current_user: CurrentUserDTO = Depends(get_current_user),
     order_service: OrderService = Depends(get_order_service),
 ) -> OrderDTO:
     dto = UpdateOrderStatusDTO(
         status=data.status,
-        order=order,
+        order_id=order_id,
         current_user=current_user,
+        expected_status=data.expected_status,
     )
     updated_order = await order_service.update_order_status(dto)
     return updated_order
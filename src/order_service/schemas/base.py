@@ -18,3 +18,10 @@ class Page(BaseSchema, Generic[T]):
     total_items: int
     page: int
     items: list[T]
+
+
+class CursorPage(BaseSchema, Generic[T]):
+    page_size: int
+    next_cursor: str | None
+    total_items: int | None
+    items: list[T]
@@ -0,0 +1,20 @@
+from order_service.schemas.base import BaseSchema
+
+
+class DbPoolStatsSchema(BaseSchema):
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+
+
+class OrderCacheStatsSchema(BaseSchema):
+    local_size: int
+    local_hits: int
+    local_misses: int
+    local_hit_ratio: float
+    redis_hits: int
+    redis_misses: int
+    redis_hit_ratio: float
@@ -1,13 +1,32 @@
 from datetime import datetime
 
+from pydantic import Field
+
+from ..dto.order import OrderCreateItemDTO
 from ..enums.order import OrderStatus
 from .base import BaseSchema
 
+MAX_BULK_ORDERS = 1000
+MAX_BATCH_FETCH_ORDERS = 100
+
 
 class OrderCreateRequestSchema(BaseSchema):
     items: dict
     order_price: float
 
+    def to_dto(self) -> OrderCreateItemDTO:
+        return OrderCreateItemDTO(
+            items=self.items,
+            order_price=self.order_price,
+        )
+
+
+class OrdersBulkCreateRequestSchema(BaseSchema):
+    orders: list[OrderCreateRequestSchema] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ORDERS,
+    )
+
 
 class OrderSchema(BaseSchema):
     id: str
@@ -20,3 +39,7 @@ class OrderSchema(BaseSchema):
 
 class OrderStatusUpdateSchema(BaseSchema):
     status: OrderStatus
+    expected_status: OrderStatus | None = Field(
+        default=None,
+        description="Only update if the order is still in this status",
+    )
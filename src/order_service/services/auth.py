@@ -1,7 +1,6 @@
 from order_service.dto.auth import LoginRequestDTO
 from order_service.dto.auth import RegistrationRequestDTO
 from order_service.dto.auth import TokenPairDTO
-from order_service.dto.user import CurrentUserDTO
 from order_service.dto.user import UserDTO
 from order_service.errors.auth import IncorrectEmailOrPasswordError
 from order_service.errors.auth import UserAlreadyExistsError
@@ -29,7 +28,7 @@ class AuthService:
         if already_exists:
             raise UserAlreadyExistsError()
 
-        hashed_password = self._auth_helper.hash_password(
+        hashed_password = await self._auth_helper.hash_password(
             data.password,
         )
 
@@ -46,7 +45,7 @@ class AuthService:
         if user is None:
             raise IncorrectEmailOrPasswordError()
 
-        password_matched = self._auth_helper.verify_password(
+        password_matched = await self._auth_helper.verify_password(
             data.password, user.hashed_password
         )
 
@@ -57,15 +56,3 @@ class AuthService:
             user_id=user.id,
             email=user.email,
         )
-
-    def get_current_user(self, token: str) -> CurrentUserDTO:
-        token_payload = self._auth_helper.extract_token_payload(
-            token,
-        )
-
-        user = CurrentUserDTO(
-            email=token_payload["email"],
-            id=token_payload["uid"],
-        )
-
-        return user
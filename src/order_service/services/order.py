@@ -1,25 +1,33 @@
 from dataclasses import asdict
+from typing import Any
 
-from faststream.kafka import KafkaBroker
+from order_service.dto.base import CursorPageDTO
 from order_service.dto.base import PageDTO
 from order_service.dto.order import OrderCreateDTO
 from order_service.dto.order import OrderDTO
+from order_service.dto.order import OrdersBatchFetchRequestDTO
+from order_service.dto.order import OrdersBulkCreateDTO
+from order_service.dto.order import OrdersCursorFetchRequestDTO
 from order_service.dto.order import OrdersFetchRequestDTO
 from order_service.dto.order import UpdateOrderStatusDTO
 from order_service.dto.user import CurrentUserDTO
 from order_service.errors.common import NotAllowedError
 from order_service.errors.common import NotFoundError
+from order_service.errors.order import OrderStatusConflictError
 from order_service.repos.order import OrderRepository
+from order_service.repos.outbox import OutboxRepository
+
+NEW_ORDER_TOPIC = "new_order"
 
 
 class OrderService:
     def __init__(
         self,
         order_repo: OrderRepository,
-        kafka_broker: KafkaBroker,
+        outbox_repo: OutboxRepository,
     ) -> None:
         self._order_repo = order_repo
-        self._broker = kafka_broker
+        self._outbox_repo = outbox_repo
 
     async def create_order(
         self,
@@ -31,10 +39,26 @@ class OrderService:
             order_price=order_create_request.order_price,
         )
 
-        await self._publish_order(created_order)
+        await self._enqueue_order_event(created_order)
 
         return created_order
 
+    async def create_orders(
+        self,
+        orders_create_request: OrdersBulkCreateDTO,
+    ) -> list[OrderDTO]:
+        created_orders = await self._order_repo.create_orders(
+            user_id=orders_create_request.current_user.id,
+            orders=orders_create_request.orders,
+        )
+
+        await self._outbox_repo.add_events(
+            topic=NEW_ORDER_TOPIC,
+            payloads=list(map(self._order_event_payload, created_orders)),
+        )
+
+        return created_orders
+
     async def fetch_orders(
         self,
         request: OrdersFetchRequestDTO,
@@ -45,18 +69,55 @@ class OrderService:
             user_id=request.user_id,
         )
 
+    async def fetch_orders_by_cursor(
+        self,
+        request: OrdersCursorFetchRequestDTO,
+    ) -> CursorPageDTO[OrderDTO]:
+        return await self._order_repo.fetch_orders_by_cursor(
+            page_size=request.page_size,
+            cursor=request.cursor,
+            user_id=request.user_id,
+            with_total=request.with_total,
+        )
+
     async def update_order_status(
         self,
         request: UpdateOrderStatusDTO,
     ) -> OrderDTO:
-        if request.order.creator_id != request.current_user.id:
+        # Compare-and-set on status: the row only changes if it is still in
+        # a state the transition table allows, no row lock is held
+        expected = request.expected_status
+        if expected is None:
+            expected_statuses = request.status.previous_statuses
+        else:
+            expected_statuses = frozenset({expected})
+
+        # A transition the table forbids can't match any row, skip the UPDATE
+        if expected is None or expected.can_transition_to(request.status):
+            updated_order = await self._order_repo.update_order_status(
+                order_id=request.order_id,
+                new_status=request.status,
+                user_id=request.current_user.id,
+                expected_statuses=expected_statuses,
+            )
+            if updated_order is not None:
+                return updated_order
+
+        # Only failed updates pay for finding out why
+        state = await self._order_repo.get_order_state(request.order_id)
+        if state is None:
+            raise NotFoundError(f"order with id = {request.order_id}")
+
+        user_id, current_status = state
+        if user_id != request.current_user.id:
             raise NotAllowedError(
-                f"You don't have an access to order {request.order.id}"
+                f"You don't have an access to order {request.order_id}"
             )
-        updated_order = await self._order_repo.update_order_status(
-            request.order, request.status
+
+        raise OrderStatusConflictError(
+            current_status=current_status,
+            requested_status=request.status,
         )
-        return updated_order
 
     async def get_order_by_id(
         self, order_id: str, current_user: CurrentUserDTO
@@ -75,8 +136,33 @@ class OrderService:
 
         return order
 
-    async def _publish_order(self, created_order: OrderDTO) -> None:
-        await self._broker.publish(
-            topic="new_order",
-            message=asdict(created_order),
+    async def get_orders_by_ids(
+        self,
+        request: OrdersBatchFetchRequestDTO,
+    ) -> list[OrderDTO]:
+        # Duplicates are looked up once, first occurrence keeps its place
+        order_ids = list(dict.fromkeys(request.order_ids))
+        found = await self._order_repo.get_orders_by_ids(order_ids)
+
+        # Unknown and foreign ids are left out alike, so existence of other
+        # users' orders is not revealed
+        return [
+            found[order_id]
+            for order_id in order_ids
+            if order_id in found
+            and found[order_id].creator_id == request.current_user.id
+        ]
+
+    async def _enqueue_order_event(self, created_order: OrderDTO) -> None:
+        # Written in the order's transaction; `OutboxRelay` publishes it
+        await self._outbox_repo.add_event(
+            topic=NEW_ORDER_TOPIC,
+            payload=self._order_event_payload(created_order),
         )
+
+    @staticmethod
+    def _order_event_payload(order: OrderDTO) -> dict[str, Any]:
+        return {
+            **asdict(order),
+            "created_at": order.created_at.isoformat(),
+        }
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+from order_service.dto.outbox import OutboxEventDTO
+from order_service.helpers.kafka import KafkaEventPublisher
+from order_service.repos.outbox import OutboxRepository
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Fire-and-forget batches waiting for acks, each holds a db connection
+MAX_UNACKED_BATCHES = 4
+
+
+class OutboxRelay:
+    """
+    Drains the outbox table to Kafka in batches.
+
+    Events are deleted in the same transaction that locked them, only once
+    the broker acked them, so delivery is at-least-once: a crash between
+    publish and commit re-sends the batch. With a confirming publisher any
+    failure rolls the whole batch back. Otherwise the acks of a batch are
+    awaited in the background while the next batches are published, and
+    only the acked events are deleted; the rest are retried by a later
+    batch, so they may arrive after newer events.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        publisher: KafkaEventPublisher,
+        batch_size: int,
+        poll_interval_seconds: float,
+    ) -> None:
+        self._session_maker = session_maker
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._task: asyncio.Task | None = None
+        self._unacked: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # Published batches still get their acked events deleted
+        await asyncio.gather(*self._unacked, return_exceptions=True)
+
+    async def relay_batch(self) -> int:
+        if len(self._unacked) >= MAX_UNACKED_BATCHES:
+            await asyncio.wait(
+                self._unacked,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+        session = self._session_maker()
+        try:
+            outbox_repo = OutboxRepository(session)
+            events = await outbox_repo.lock_pending_events(self._batch_size)
+            acks = await self._publisher.publish_many(
+                (e.topic, e.payload, e.trace_context) for e in events
+            )
+        except BaseException:
+            await session.close()
+            raise
+
+        if not events:
+            await session.close()
+            return 0
+
+        delete_acked = self._delete_acked(session, events, acks)
+        if self._publisher.confirm:
+            await delete_acked
+            return len(events)
+
+        task = asyncio.create_task(delete_acked)
+        self._unacked.add(task)
+        task.add_done_callback(self._on_acked_deleted)
+        return len(events)
+
+    def _on_acked_deleted(self, task: asyncio.Task) -> None:
+        self._unacked.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(msg="Outbox relay failed", exc_info=task.exception())
+
+    async def _delete_acked(
+        self,
+        session: AsyncSession,
+        events: list[OutboxEventDTO],
+        acks: list[asyncio.Future],
+    ) -> None:
+        # The rows stay locked meanwhile, so other batches skip them
+        async with session:
+            results = await asyncio.gather(*acks, return_exceptions=True)
+            acked_ids = [
+                event.id
+                for event, result in zip(events, results)
+                if not isinstance(result, BaseException)
+            ]
+            if len(acked_ids) < len(events):
+                logging.warning(
+                    "%s of %s outbox events were not acked, left for retry",
+                    len(events) - len(acked_ids),
+                    len(events),
+                )
+
+            await OutboxRepository(session).delete_events(acked_ids)
+            await session.commit()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception as error:
+                logging.error(msg="Outbox relay failed", exc_info=error)
+                relayed = 0
+
+            # A full batch means there is probably more to drain right away
+            if relayed < self._batch_size:
+                await asyncio.sleep(self._poll_interval_seconds)
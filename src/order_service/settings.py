@@ -1,6 +1,12 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
+KafkaCompressionType = Literal["gzip", "snappy", "lz4", "zstd"]
+TracingExporter = Literal["otlp", "memory"]
+OrderCacheFormat = Literal["hash", "json"]
+
 
 def split_csv(value: str) -> list[str]:
     items = [item.strip() for item in value.split(",")]
@@ -10,6 +16,13 @@ def split_csv(value: str) -> list[str]:
 class Settings(BaseSettings):
     redis_dsn: str = "redis://redis:6379/0"
     broker_url: str = "kafka:9092"
+    kafka_acks: Literal["0", "1", "all"] = "all"
+    kafka_enable_idempotence: bool = False
+    kafka_linger_ms: int = 5
+    kafka_max_batch_size: int = 65536
+    kafka_compression_type: KafkaCompressionType | None = None
+    kafka_publish_mode: Literal["confirm", "fire_and_forget"] = "confirm"
+    kafka_max_in_flight: int = 1000
 
     db_user: str
     db_password: str
@@ -18,17 +31,55 @@ class Settings(BaseSettings):
     db_name: str
     db_driver: str = "postgresql+asyncpg"
     db_sync_driver: str = "postgresql+psycopg2"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_prepared_statement_cache_size: int = 100
 
     jwt_secret_key: str
     jwt_hashing_algorithm: str = "HS256"
     jwt_access_token_expiration_minutes: int = 30
     jwt_refresh_token_expiration_minutes: int = 80
+    jwt_cache_max_size: int = 10_000
+    jwt_cache_ttl_seconds: int = 60
+
+    # Bearer token of `/internal/*` and `/metrics`, empty disables them
+    internal_api_token: str = ""
+
+    password_hashing_executor: Literal["thread", "process"] = "thread"
+    password_hashing_workers: int = 4
+    password_hashing_max_queue_size: int = 128
 
     logging_lvl: str = "INFO"
     logging_fmt: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    slowapi_ratelimit: str = "30/minute"
+    rate_limit_read: str = "120/minute"
+    rate_limit_write: str = "30/minute"
+    rate_limit_auth: str = "30/minute"
+    rate_limit_ip: str = "600/minute"
+    rate_limit_redis_timeout_ms: int = 50
+
     order_cache_ttl_seconds: int = 300
+    order_local_cache_max_size: int = 10_000
+    order_local_cache_ttl_seconds: float = 5
+    order_negative_cache_ttl_seconds: int = 5
+    order_cache_load_lock_ttl_ms: int = 2000
+    order_cache_early_refresh_beta: float = 1.0
+    # Older releases only read `hash`: switch to `json` in a second rollout,
+    # once every API and worker replica runs a release that reads both
+    order_cache_format: OrderCacheFormat = "hash"
+    order_listing_cache_ttl_seconds: int = 30
+
+    outbox_relay_enabled: bool = True
+    outbox_batch_size: int = 500
+    outbox_poll_interval_seconds: float = 0.2
+
+    tracing_enabled: bool = False
+    tracing_exporter: TracingExporter = "otlp"
+    tracing_otlp_endpoint: str = "http://otel-collector:4318"
+    tracing_sample_ratio: float = 1.0
 
     cors_allow_origins: list[str] = ["*"]
     cors_allow_headers: list[str] = ["*"]
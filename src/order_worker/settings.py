@@ -1,8 +1,34 @@
+from order_service.settings import OrderCacheFormat
+from order_service.settings import TracingExporter
 from pydantic_settings import BaseSettings
+from pydantic_settings import SettingsConfigDict
 
 
 class Settings(BaseSettings):
     redis_dsn: str = "redis://redis:6379/0"
 
+    db_user: str = "order_service_user"
+    db_password: str = "order_service"
+    db_host: str = "db"
+    db_port: int = 5432
+    db_name: str = "order_service"
+    db_driver: str = "postgresql+asyncpg"
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_pre_ping: bool = True
+
+    order_cache_ttl_seconds: int = 300
+    # See `order_service.settings.Settings.order_cache_format`
+    order_cache_format: OrderCacheFormat = "hash"
+
+    tracing_enabled: bool = False
+    tracing_exporter: TracingExporter = "otlp"
+    tracing_otlp_endpoint: str = "http://otel-collector:4318"
+    tracing_sample_ratio: float = 1.0
+
+    model_config = SettingsConfigDict(
+        extra="ignore", env_ignore_empty=True, env_file=".env"
+    )
+
 
 settings = Settings()
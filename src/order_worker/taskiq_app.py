@@ -1,20 +1,131 @@
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from order_service.helpers.redis_client import InstrumentedRedis
+from order_service.helpers.tracing import build_span_exporter
+from order_service.helpers.tracing import configure_tracing
+from order_service.helpers.tracing import trace_queries
+from order_service.repos.order import OrderCacheScripts
 from order_worker.settings import settings
+from redis.asyncio import Redis
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from taskiq import AsyncTaskiqDecoratedTask
+from taskiq import BrokerMessage
 from taskiq import TaskiqEvents
+from taskiq import TaskiqMessage
 from taskiq import TaskiqState
 from taskiq_redis import RedisAsyncResultBackend
 from taskiq_redis import RedisStreamBroker
 
+
+class BatchRedisStreamBroker(RedisStreamBroker):
+    """Redis stream broker that can enqueue many tasks in one round trip."""
+
+    async def kick_batch(self, messages: list[BrokerMessage]) -> None:
+        async with Redis(connection_pool=self.connection_pool) as redis_conn:
+            pipe = redis_conn.pipeline(transaction=False)
+            for message in messages:
+                pipe.xadd(
+                    message.labels.get("queue_name") or self.queue_name,
+                    {b"data": message.message},
+                    maxlen=self.maxlen,
+                    approximate=self.approximate,
+                )
+            await pipe.execute()
+
+    async def kiq_batch(
+        self,
+        task: AsyncTaskiqDecoratedTask,
+        payloads: Iterable[Any],
+        labels: Iterable[dict[str, str]] | None = None,
+    ) -> None:
+        """
+        Like `task.kiq(payload)` for every payload, but pipelined.
+
+        Broker middlewares do not run here, so trace context has to come in
+        as `labels`: one dict per payload, e.g. the trace headers of the
+        Kafka message it was consumed from.
+        """
+        payloads = list(payloads)
+        payload_labels = list(labels) if labels is not None else []
+        payload_labels += [{}] * (len(payloads) - len(payload_labels))
+        messages = [
+            self.formatter.dumps(
+                TaskiqMessage(
+                    task_id=self.id_generator(),
+                    task_name=task.task_name,
+                    labels=dict(message_labels),
+                    labels_types={},
+                    args=[payload],
+                    kwargs={},
+                )
+            )
+            for payload, message_labels in zip(payloads, payload_labels)
+        ]
+        if messages:
+            await self.kick_batch(messages)
+
+
 result_backend = RedisAsyncResultBackend(settings.redis_dsn)
-broker = RedisStreamBroker(settings.redis_dsn).with_result_backend(
+broker = BatchRedisStreamBroker(settings.redis_dsn).with_result_backend(
     result_backend,
 )
+if settings.tracing_enabled:
+    from taskiq.middlewares.opentelemetry_middleware import (
+        OpenTelemetryMiddleware,
+    )
+
+    # Injects the trace context into labels on `kiq` and continues it in
+    # the worker; spans go to the provider of the process, see below
+    broker.add_middlewares(OpenTelemetryMiddleware())
 
 
 @broker.on_event(TaskiqEvents.WORKER_STARTUP)
 async def worker_startup(state: TaskiqState) -> None:
-    print("TaskIQ worker started")
+    if settings.tracing_enabled:
+        configure_tracing(
+            "order-worker",
+            build_span_exporter(
+                settings.tracing_exporter,
+                settings.tracing_otlp_endpoint,
+            ),
+            sample_ratio=settings.tracing_sample_ratio,
+        )
+
+    uri = URL.create(
+        drivername=settings.db_driver,
+        username=settings.db_user,
+        password=settings.db_password,
+        host=settings.db_host,
+        port=settings.db_port,
+        database=settings.db_name,
+    )
+    state.engine = create_async_engine(
+        uri,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if settings.tracing_enabled:
+        trace_queries(state.engine)
+    state.session_maker = async_sessionmaker(
+        bind=state.engine,
+        expire_on_commit=False,
+    )
+    state.redis = InstrumentedRedis.from_url(
+        settings.redis_dsn,
+        decode_responses=True,
+    )
+    state.order_cache_scripts = OrderCacheScripts.register(state.redis)
+    logging.info("TaskIQ worker started")
 
 
 @broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
 async def worker_shutdown(state: TaskiqState) -> None:
-    print("TaskIQ worker stopped")
+    # Runs after the receiver drained in-flight tasks (--wait-tasks-timeout)
+    await state.redis.aclose()
+    await state.engine.dispose()
+    logging.info("TaskIQ worker stopped")
@@ -1,9 +1,38 @@
-import asyncio
+import logging
 
+from order_service.enums.order import OrderStatus
+from order_service.helpers.order_codec import get_order_codec
+from order_service.repos.base import run_after_commit
+from order_service.repos.order import OrderRepository
+from order_worker.settings import settings
 from order_worker.taskiq_app import broker
+from taskiq import TaskiqDepends
+from taskiq import TaskiqState
 
 
 @broker.task
-async def process_incoming_order(payload: dict) -> None:
-    await asyncio.sleep(2)
-    print(f"Order {payload['id']} processed", flush=True)
+async def process_incoming_order(
+    payload: dict,
+    state: TaskiqState = TaskiqDepends(),
+) -> None:
+    async with state.session_maker() as session, session.begin():
+        order_repo = OrderRepository(
+            session,
+            state.redis,
+            order_cache_ttl_seconds=settings.order_cache_ttl_seconds,
+            cache_codec=get_order_codec(settings.order_cache_format),
+            scripts=state.order_cache_scripts,
+        )
+        # Conditional on PENDING, so redelivered messages are no-ops
+        order = await order_repo.update_order_status(
+            payload["id"],
+            new_status=OrderStatus.PAID,
+            expected_statuses=[OrderStatus.PENDING],
+        )
+    await run_after_commit(session)
+
+    if order is None:
+        logging.info("Order %s skipped: not pending", payload["id"])
+        return
+
+    logging.info("Order %s processed", order.id)
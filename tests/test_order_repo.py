@@ -0,0 +1,23 @@
+from order_service.enums.order import OrderStatus
+from order_service.repos.order import OrderRepository
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def test_create_order_runs_a_single_insert(
+    session: AsyncSession,
+    statements: list[str],
+) -> None:
+    # The cache is written after commit, so no Redis server is needed
+    repo = OrderRepository(session, Redis())
+
+    order = await repo.create_order(
+        user_id="user-1",
+        items={"sku-1": 2},
+        order_price=9.5,
+    )
+
+    assert len(statements) == 1
+    assert statements[0].startswith('INSERT INTO "order"')
+    assert order.creator_id == "user-1"
+    assert order.status == OrderStatus.PENDING